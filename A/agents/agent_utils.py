@@ -2,49 +2,65 @@
 
 from __future__ import annotations
 
+import json
 import re
+import sys
 from collections import Counter
-from typing import Dict, List
-
-STOPWORDS = {
-    "the",
-    "and",
-    "for",
-    "with",
-    "that",
-    "from",
-    "into",
-    "this",
-    "your",
-    "their",
-    "about",
-    "will",
-    "make",
-    "build",
-    "help",
-    "using",
-    "through",
-    "across",
-    "data",
-    "user",
-    "users",
-    "product",
-    "ai",
-    "artificial",
-    "intelligence",
-    "system",
-    "platform",
-    "experience",
-    "solution",
-    "create",
-    "creating",
-    "design",
-    "digital",
-    "idea",
-    "ideas",
-    "team",
-    "teams",
-}
+from functools import lru_cache
+from pathlib import Path
+from string import Formatter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Pattern, Tuple
+
+import ahocorasick  # type: ignore
+
+
+def _normalize_terms(terms: set[str]) -> frozenset[str]:
+    # Inputs are lowercased once in tokenize()/detect_attributes, so keyword sets must be too.
+    return frozenset(term.strip().lower() for term in terms)
+
+
+STOPWORDS: frozenset[str] = _normalize_terms(
+    {
+        "the",
+        "and",
+        "for",
+        "with",
+        "that",
+        "from",
+        "into",
+        "this",
+        "your",
+        "their",
+        "about",
+        "will",
+        "make",
+        "build",
+        "help",
+        "using",
+        "through",
+        "across",
+        "data",
+        "user",
+        "users",
+        "product",
+        "ai",
+        "artificial",
+        "intelligence",
+        "system",
+        "platform",
+        "experience",
+        "solution",
+        "create",
+        "creating",
+        "design",
+        "digital",
+        "idea",
+        "ideas",
+        "team",
+        "teams",
+    }
+)
 
 DOMAIN_CATEGORY = {
     "Healthcare & Wellness": "Healthcare",
@@ -60,59 +76,145 @@ DOMAIN_CATEGORY = {
     "Technology & Innovation": "Innovation",
 }
 
-ATTRIBUTE_KEYWORDS: Dict[str, set[str]] = {
-    "regulatory": {
-        "regulation",
-        "regulated",
-        "compliance",
-        "hipaa",
-        "gdpr",
-        "sox",
-        "audit",
-        "risk",
-        "governance",
-    },
-    "marketplace": {
-        "marketplace",
-        "two-sided",
-        "multi-sided",
-        "buyers",
-        "sellers",
-        "vendors",
-        "matching",
-    },
-    "hardware": {
-        "hardware",
-        "device",
-        "sensor",
-        "iot",
-        "wearable",
-        "embedded",
-    },
-    "realtime": {
-        "real-time",
-        "realtime",
-        "live",
-        "streaming",
-        "instant",
-        "event-driven",
-    },
-    "data_heavy": {
-        "analytics",
-        "warehouse",
-        "lakehouse",
-        "big data",
-        "data",
-        "insight",
-        "forecast",
-    },
-    "mobile": {"mobile", "ios", "android", "smartphone"},
-    "enterprise": {"enterprise", "fortune", "corporate", "global"},
-    "community": {"community", "social", "network", "member"},
-    "developer": {"developer", "api", "sdk", "cli", "devops"},
-    "ai_native": {"agent", "agents", "multi-agent", "autonomous"},
+_domain_lookup = DOMAIN_CATEGORY.get
+
+# Trigger phrases derived from each display name, in DOMAIN_CATEGORY priority order.
+_DOMAIN_TRIGGERS: Tuple[Tuple[str, str], ...] = tuple(
+    (token.strip().lower(), domain)
+    for domain in DOMAIN_CATEGORY
+    for token in domain.replace("&", ",").split(",")
+    if token.strip()
+)
+
+AUDIENCE_RULES: Tuple[Tuple[str, str], ...] = (
+    ("founder", "Founders and product leaders"),
+    ("startup", "Founders and product leaders"),
+    ("entrepreneur", "Founders and product leaders"),
+    ("operations", "Operations and strategy teams"),
+    ("strategy", "Operations and strategy teams"),
+    ("pm", "Product managers and discovery leads"),
+    ("enterprise", "Enterprise innovation teams"),
+    ("developer", "Developers and technical platform teams"),
+    ("engineer", "Developers and technical platform teams"),
+    ("marketing", "Growth and marketing leadership"),
+    ("growth", "Growth and marketing leadership"),
+    ("customer", "Customer success and revenue leaders"),
+    ("cs", "Customer success and revenue leaders"),
+    ("education", "Learning and enablement leaders"),
+    ("sustain", "Sustainability and impact leaders"),
+    ("consumer", "Design-forward consumers"),
+)
+
+
+class KeywordRules(NamedTuple):
+    """Priority-ordered keyword rules matched with a single regex scan."""
+
+    matcher: Pattern[str]
+    ranks: Dict[str, int]
+    outcomes: Tuple[str, ...]
+
+    def first(self, lowered: str, default: str) -> str:
+        # The highest-priority rule with any keyword present wins, wherever it appears in the text.
+        rank = min((self.ranks[match.group(1)] for match in self.matcher.finditer(lowered)), default=None)
+        return default if rank is None else self.outcomes[rank]
+
+
+def compile_keyword_rules(rules: Tuple[Tuple[Tuple[str, ...], str], ...]) -> KeywordRules:
+    """Compile ``(keywords, outcome)`` rules, highest priority first, into one matcher."""
+
+    ranks: Dict[str, int] = {}
+    for rank, (keywords, _) in enumerate(rules):
+        for keyword in keywords:
+            ranks.setdefault(keyword, rank)
+    # A lookahead alternation reports overlapping keywords ("pm" inside "development") in one
+    # pass, but only the first alternative that matches at each position. Listing keywords in
+    # priority order makes that the best-ranked one, so a keyword hidden behind another that
+    # shares its start (e.g. a prefix) can never be the one first() would have picked.
+    ordered = sorted(ranks, key=ranks.__getitem__)
+    matcher = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+    return KeywordRules(matcher, ranks, tuple(outcome for _, outcome in rules))
+
+
+_AUDIENCE_RULES = compile_keyword_rules(tuple(((keyword,), audience) for keyword, audience in AUDIENCE_RULES))
+
+ATTRIBUTE_KEYWORDS: Dict[str, frozenset[str]] = {
+    "regulatory": _normalize_terms(
+        {
+            "regulation",
+            "regulated",
+            "compliance",
+            "hipaa",
+            "gdpr",
+            "sox",
+            "audit",
+            "risk",
+            "governance",
+        }
+    ),
+    "marketplace": _normalize_terms(
+        {
+            "marketplace",
+            "two-sided",
+            "multi-sided",
+            "buyers",
+            "sellers",
+            "vendors",
+            "matching",
+        }
+    ),
+    "hardware": _normalize_terms(
+        {
+            "hardware",
+            "device",
+            "sensor",
+            "iot",
+            "wearable",
+            "embedded",
+        }
+    ),
+    "realtime": _normalize_terms(
+        {
+            "real-time",
+            "realtime",
+            "live",
+            "streaming",
+            "instant",
+            "event-driven",
+        }
+    ),
+    "data_heavy": _normalize_terms(
+        {
+            "analytics",
+            "warehouse",
+            "lakehouse",
+            "big data",
+            "data",
+            "insight",
+            "forecast",
+        }
+    ),
+    "mobile": _normalize_terms({"mobile", "ios", "android", "smartphone"}),
+    "enterprise": _normalize_terms({"enterprise", "fortune", "corporate", "global"}),
+    "community": _normalize_terms({"community", "social", "network", "member"}),
+    "developer": _normalize_terms({"developer", "api", "sdk", "cli", "devops"}),
+    "ai_native": _normalize_terms({"agent", "agents", "multi-agent", "autonomous"}),
 }
 
+KEYWORD_TO_ATTRIBUTE: Dict[str, str] = {
+    keyword: name for name, keywords in ATTRIBUTE_KEYWORDS.items() for keyword in keywords
+}
+
+# One automaton pass reports every (possibly overlapping) keyword occurrence.
+_ATTRIBUTE_AUTOMATON = ahocorasick.Automaton()
+for _keyword, _name in KEYWORD_TO_ATTRIBUTE.items():
+    _ATTRIBUTE_AUTOMATON.add_word(_keyword, _name)
+_ATTRIBUTE_AUTOMATON.make_automaton()
+
+# A single precompiled findall; str.translate + split measured no faster once tokens must start with a letter.
+_WORD_RE = re.compile(r"[a-z][a-z0-9-]+")
+_SENTENCE_BREAK_RE = re.compile(r"[.!?]\s+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 COMPLEXITY_WEIGHTS: Dict[str, int] = {
     "regulatory": 2,
     "marketplace": 2,
@@ -125,1195 +227,100 @@ COMPLEXITY_WEIGHTS: Dict[str, int] = {
     "community": 1,
 }
 
-BUSINESS_TEMPLATES: Dict[str, Dict[str, object]] = {
-    "Healthcare": {
-        "model": "Compliance-first SaaS with expert enablement",
-        "pricing": "Pilot-based pricing tied to clinical outcomes and scale",
-        "revenue": [
-            "Clinical innovation subscription for care teams",
-            "Implementation & interoperability services",
-            "Outcome analytics add-ons for administrators",
-        ],
-        "gtm": "Co-create with {audience} and hospital innovation programs, spotlighting measurable patient impact in the {domain} space.",
-        "partners": [
-            "Hospital innovation labs",
-            "EHR / HL7 integration specialists",
-            "Clinical research networks",
-        ],
-        "key_metrics": [
-            "Patient outcome uplift after pilot",
-            "Compliance audit pass rate",
-            "Care team activation within 60 days",
-        ],
-        "enablement": [
-            "Clinical validation briefs",
-            "Security & compliance FAQ",
-            "ROI calculator tailored to administrators",
-        ],
-        "expansion": "Expand into adjacent care pathways once regulatory approvals are secured.",
-    },
-    "Finance": {
-        "model": "Risk-aware SaaS with premium analytics services",
-        "pricing": "Tiered pricing aligned to assets under management and automation throughput",
-        "revenue": [
-            "Core compliance & automation subscription",
-            "Premium risk analytics dashboards",
-            "Advisory integrations and onboarding services",
-        ],
-        "gtm": "Leverage {audience} relationships and fintech sandboxes, emphasising trust, controls, and measurable ROI in {domain}.",
-        "partners": [
-            "Fintech accelerators & regulatory sandboxes",
-            "Core banking and payment processors",
-            "Audit and compliance consultancies",
-        ],
-        "key_metrics": [
-            "Time-to-compliance reduction",
-            "Automation-driven cost savings",
-            "Portfolio coverage within 90 days",
-        ],
-        "enablement": [
-            "Regulator-ready security brief",
-            "Value justification deck with benchmarks",
-            "Integration playbooks for core systems",
-        ],
-        "expansion": "Layer on adjacent risk products once trust is established with early adopters.",
-    },
-    "Education": {
-        "model": "Learning innovation platform with cohort services",
-        "pricing": "Per-program licensing with learner volume accelerators",
-        "revenue": [
-            "Institutional subscription",
-            "Curriculum design & accreditation services",
-            "Learning analytics premium module",
-        ],
-        "gtm": "Activate {audience} champions within universities and bootcamps, pairing thought leadership with credentialed pilots across {domain}.",
-        "partners": [
-            "Edtech accelerators",
-            "Curriculum design experts",
-            "Learning management vendors",
-        ],
-        "key_metrics": [
-            "Learner engagement score",
-            "Time-to-curriculum refresh",
-            "Placement or certification uplift",
-        ],
-        "enablement": [
-            "Instructional design case studies",
-            "Learner journey storyboard",
-            "Funding & grants negotiation toolkit",
-        ],
-        "expansion": "Extend to corporate enablement and lifelong learning marketplaces once initial programs excel.",
-    },
-    "Commerce": {
-        "model": "Experience-led commerce platform with monetised insights",
-        "pricing": "GMV-linked SaaS with performance-based boosters",
-        "revenue": [
-            "Core storefront intelligence subscription",
-            "Conversion-optimisation services",
-            "Data monetisation via benchmarks",
-        ],
-        "gtm": "Target {audience} within high-growth brands, co-market with ecosystem agencies, and prove conversion lift across {domain} segments.",
-        "partners": [
-            "E-commerce agencies",
-            "Logistics & fulfilment networks",
-            "Payment providers",
-        ],
-        "key_metrics": [
-            "Average order value lift",
-            "Checkout conversion increase",
-            "Customer lifetime value expansion",
-        ],
-        "enablement": [
-            "Merchandising playbook",
-            "Experiment roadmap template",
-            "Executive dashboard mockups",
-        ],
-        "expansion": "Scale into new verticals via channel partnerships and white-label intelligence.",
-    },
-    "Productivity": {
-        "model": "Workflow orchestration platform with analytics add-ons",
-        "pricing": "Seat-based pricing with outcome accelerators",
-        "revenue": [
-            "Core workspace subscription",
-            "Automation marketplace",
-            "Insights & governance module",
-        ],
-        "gtm": "Launch with {audience} inside product-led organisations, emphasising measurable cross-team velocity in the {domain} arena.",
-        "partners": [
-            "Product-led growth communities",
-            "Product ops consultancies",
-            "Integration partners (Slack, Atlassian)",
-        ],
-        "key_metrics": [
-            "Workflow completion velocity",
-            "Cross-team alignment score",
-            "Automation adoption within 30 days",
-        ],
-        "enablement": [
-            "Change management toolkit",
-            "Operational maturity benchmark",
-            "Executive summary narrative",
-        ],
-        "expansion": "Expand into adjacent departments once flagship workspace metrics are achieved.",
-    },
-    "Customer": {
-        "model": "Customer intelligence hub with service automation",
-        "pricing": "Tiered pricing aligned to customer volume and SLAs",
-        "revenue": [
-            "Insight subscription",
-            "Service automation add-ons",
-            "Voice of customer analytics",
-        ],
-        "gtm": "Equip {audience} with proof of CSAT gains and time-to-resolution improvements within {domain} teams.",
-        "partners": [
-            "CX consultancies",
-            "CRM vendors",
-            "Support community programs",
-        ],
-        "key_metrics": [
-            "CSAT / NPS uplift",
-            "First-response automation coverage",
-            "Retention increase across segments",
-        ],
-        "enablement": [
-            "Executive listening tour agenda",
-            "Customer journey storyboard",
-            "Automation ROI worksheet",
-        ],
-        "expansion": "Layer in revenue enablement offerings once support motion proves value.",
-    },
-    "Developer": {
-        "model": "Usage-based API platform with collaboration seats",
-        "pricing": "Pay-as-you-go API meters plus enterprise support plans",
-        "revenue": [
-            "Core API consumption",
-            "Premium orchestration add-ons",
-            "Enterprise success engineering",
-        ],
-        "gtm": "Drive adoption through {audience}, open-source showcases, and deep integration tutorials tailored to {domain} builders.",
-        "partners": [
-            "Developer advocacy communities",
-            "Cloud marketplaces",
-            "Systems integrators",
-        ],
-        "key_metrics": [
-            "Active developers",
-            "Time-to-first-integration",
-            "Production usage retention",
-        ],
-        "enablement": [
-            "Reference architecture kits",
-            "Postman / SDK bundles",
-            "Proof-of-concept accelerator scripts",
-        ],
-        "expansion": "Grow into ecosystem marketplaces and private deployments as enterprise demand matures.",
-    },
-    "Marketing": {
-        "model": "Campaign intelligence platform with experiment services",
-        "pricing": "Channel-based tiering with performance bonuses",
-        "revenue": [
-            "Growth intelligence subscription",
-            "Managed experiment services",
-            "Attribution analytics add-on",
-        ],
-        "gtm": "Collaborate with {audience} to launch lighthouse growth experiments and publish benchmark reports across {domain}.",
-        "partners": [
-            "Growth agencies",
-            "Ad platforms",
-            "Influencer networks",
-        ],
-        "key_metrics": [
-            "Cost per acquisition improvement",
-            "Campaign experiment velocity",
-            "Pipeline contribution",
-        ],
-        "enablement": [
-            "Campaign hypothesis library",
-            "Executive revenue alignment narrative",
-            "Attribution modelling toolkit",
-        ],
-        "expansion": "Introduce ecosystem marketplaces and co-marketing alliances after initial channel mastery.",
-    },
-    "Sustainability": {
-        "model": "Impact data platform with advisory overlays",
-        "pricing": "Subscription indexed to emissions footprint and reporting scope",
-        "revenue": [
-            "ESG reporting subscription",
-            "Carbon reduction advisory",
-            "Marketplace of certified partners",
-        ],
-        "gtm": "Activate {audience} and sustainability leads, uniting regulatory compliance with innovation narratives in {domain}.",
-        "partners": [
-            "Climate tech alliances",
-            "Regulatory consultants",
-            "Data providers (emissions, offsets)",
-        ],
-        "key_metrics": [
-            "Emission reduction verified",
-            "Reporting cycle compression",
-            "Partner program expansion",
-        ],
-        "enablement": [
-            "ESG storytelling kit",
-            "Regulatory mapping template",
-            "Executive sustainability heatmap",
-        ],
-        "expansion": "Scale into supply chain transparency once carbon accounting flywheel spins.",
-    },
-    "Industry": {
-        "model": "Operational intelligence platform with edge services",
-        "pricing": "Footprint-based pricing with production outcome bonuses",
-        "revenue": [
-            "Factory orchestration subscription",
-            "Predictive maintenance services",
-            "Supply-chain visibility add-ons",
-        ],
-        "gtm": "Partner with {audience} and industrial innovation labs to prove downtime reduction across {domain} plants.",
-        "partners": [
-            "Systems integrators",
-            "IoT hardware vendors",
-            "Manufacturing associations",
-        ],
-        "key_metrics": [
-            "Downtime reduction",
-            "Yield improvement",
-            "Throughput increase",
-        ],
-        "enablement": [
-            "Operational excellence playbook",
-            "Factory data readiness assessment",
-            "Change management workshop kit",
-        ],
-        "expansion": "Expand regionally via strategic OEM alliances and reseller channels.",
-    },
-    "Innovation": {
-        "model": "Multi-agent SaaS with advisory overlays",
-        "pricing": "Tiered SaaS plus outcomes-based accelerator programs",
-        "revenue": [
-            "Core multi-agent workspace",
-            "Strategic advisory sprints",
-            "Data & integration marketplace",
-        ],
-        "gtm": "Inspire {audience} through founder stories, live blueprint showcases, and community-led launches across {domain}.",
-        "partners": [
-            "Venture studios",
-            "Startup communities",
-            "Tooling ecosystems",
-        ],
-        "key_metrics": [
-            "Blueprint completion velocity",
-            "Pilot conversion to build",
-            "Founder NPS",
-        ],
-        "enablement": [
-            "Investor storytelling pack",
-            "Blueprint KPI dashboard",
-            "Launch playbook for co-marketing",
-        ],
-        "expansion": "Add vertical-specific playbooks once initial cohorts show repeatable wins.",
-    },
+# Attributes without an explicit weight count as 1 toward complexity.
+_ATTRIBUTE_WEIGHTS: Dict[str, int] = {
+    name: COMPLEXITY_WEIGHTS.get(name, 1) for name in ATTRIBUTE_KEYWORDS
 }
 
-TECH_TEMPLATES: Dict[str, Dict[str, object]] = {
-    "Healthcare": {
-        "architecture": "HIPAA-ready service mesh with governed clinical knowledge lake and audit-first workflows",
-        "stack": [
-            "FastAPI microservices",
-            "React / Next.js experience layer",
-            "FHIR-compatible PostgreSQL + pgvector",
-            "Airflow & dbt for governed pipelines",
-            "Event bus via Kafka",
-        ],
-        "ai": [
-            "Retrieval-augmented generation over clinical protocols",
-            "Agent triage for risk stratification",
-            "Quality guardrails monitoring hallucinations and compliance",
-        ],
-        "service": [
-            "Identity & consent management",
-            "Clinical evidence tagging engine",
-            "Blueprint orchestration service",
-        ],
-        "data": "Govern protected health information via encrypted data lake, lineage tracking, and role-based access.",
-        "devops": [
-            "Terraform IaC with environment blueprints",
-            "GitHub Actions → Argo Rollouts for progressive delivery",
-            "Automated compliance checks & audit logging",
-        ],
-        "integration": [
-            "EHR / EMR platforms",
-            "Analytics warehouse (Snowflake / BigQuery)",
-            "Customer success tooling",
-        ],
-    },
-    "Finance": {
-        "architecture": "Zero-trust microservices with streaming risk engine and immutable audit ledger",
-        "stack": [
-            "Python FastAPI or JVM services",
-            "React + Ant Design ops console",
-            "PostgreSQL + Vitess for ledgering",
-            "Kafka Streams for real-time scoring",
-            "Lakehouse via Delta or Iceberg",
-        ],
-        "ai": [
-            "Compliance-aware reasoning agents",
-            "Anomaly detection on transactional data",
-            "Scenario simulation co-pilots",
-        ],
-        "service": [
-            "Policy engine & rules studio",
-            "Risk dashboard",
-            "Partner integration hub",
-        ],
-        "data": "Encrypted columnar storage with fine-grained entitlements and immutable audit trails.",
-        "devops": [
-            "Terraform & Atlantis workflows",
-            "Chaos testing in non-prod",
-            "Continuous compliance scanners",
-        ],
-        "integration": [
-            "Core banking systems",
-            "Identity providers",
-            "RegTech feeds",
-        ],
-    },
-    "Education": {
-        "architecture": "Modular learning fabric with adaptive content engine and analytics lake",
-        "stack": [
-            "FastAPI or NestJS services",
-            "Next.js / Tailwind front-end",
-            "Postgres + pgvector for content",
-            "Superset or Metabase analytics",
-            "Event streaming via Redpanda",
-        ],
-        "ai": [
-            "Curriculum summarisation agents",
-            "Personalised learning coach",
-            "Assessment feedback generator",
-        ],
-        "service": [
-            "Persona & cohort manager",
-            "Content tagging & recommendation",
-            "Credentialing & assessment",
-        ],
-        "data": "Capture learner telemetry into lakehouse with privacy-preserving segmentation.",
-        "devops": [
-            "Terraform + GitHub Actions",
-            "Feature flag orchestration",
-            "Observability stack (OpenTelemetry)",
-        ],
-        "integration": [
-            "LMS platforms",
-            "Video & conferencing APIs",
-            "Student information systems",
-        ],
-    },
-    "Commerce": {
-        "architecture": "Event-driven commerce core with personalization engine and experimentation layer",
-        "stack": [
-            "Node.js / FastAPI microservices",
-            "React storefront & design system",
-            "PostgreSQL + Redis for sessions",
-            "Segment + Snowflake analytics",
-            "Kafka / Pulsar event backbone",
-        ],
-        "ai": [
-            "Dynamic merchandising agent",
-            "Pricing optimiser",
-            "Customer journey summariser",
-        ],
-        "service": [
-            "Catalog enrichment",
-            "Experiment management",
-            "Marketplace orchestration",
-        ],
-        "data": "Unify shopper telemetry and transactions within governed lakehouse for omni-channel insights.",
-        "devops": [
-            "Infrastructure as code (Terraform)",
-            "Canary deploys via Argo",
-            "Synthetic journey monitoring",
-        ],
-        "integration": [
-            "Payment gateways",
-            "Logistics APIs",
-            "Marketing automation",
-        ],
-    },
-    "Productivity": {
-        "architecture": "Composable workspace fabric with knowledge graph and automation bus",
-        "stack": [
-            "Python FastAPI",
-            "React + Chakra UI",
-            "PostgreSQL + Neo4j knowledge graph",
-            "Celery / Dramatiq workers",
-            "ClickHouse analytics",
-        ],
-        "ai": [
-            "Workflow summarisation agents",
-            "Meeting synthesis",
-            "Decision memory assistant",
-        ],
-        "service": [
-            "Workspace orchestration",
-            "Playbook library",
-            "Integration controller",
-        ],
-        "data": "Capture work artefacts in searchable embeddings with strict workspace boundaries.",
-        "devops": [
-            "Terraform + GitHub Actions",
-            "Service level objectives with SLO dashboards",
-            "Feature toggle guardrails",
-        ],
-        "integration": [
-            "Slack / Teams",
-            "Project management suites",
-            "Identity providers",
-        ],
-    },
-    "Customer": {
-        "architecture": "Unified customer intelligence lakehouse with service automation rail",
-        "stack": [
-            "Python / Go services",
-            "React + Storybook",
-            "Postgres + ClickHouse",
-            "Airbyte ingestion",
-            "Snowflake warehouse",
-        ],
-        "ai": [
-    "Sentiment clustering agents",
-    "Playbook recommendation",
-    "Auto-generated QBR narratives",
-        ],
-        "service": [
-            "Signal ingestion",
-            "Success planning",
-            "Feedback triage",
-        ],
-        "data": "Blend CS data sources with customer journey signals into governed warehouse.",
-        "devops": [
-            "IaC + policy-as-code",
-            "Golden signal monitoring",
-            "Incident simulation",
-        ],
-        "integration": [
-            "CRM suites",
-            "Support platforms",
-            "Product analytics",
-        ],
-    },
-    "Developer": {
-        "architecture": "API-first control plane with event mesh and developer experience portal",
-        "stack": [
-            "Go / Rust core services",
-            "GraphQL gateway",
-            "PostgreSQL + Redis",
-            "OpenTelemetry everywhere",
-            "Vectordb (Weaviate / Pinecone)",
-        ],
-        "ai": [
-            "Code assistant for integrations",
-            "Runbook summariser",
-            "API anomaly detection",
-        ],
-        "service": [
-            "Usage analytics",
-            "Credential & secret vault",
-            "Extension marketplace",
-        ],
-        "data": "Track usage telemetry and error budgets with redaction for customer data.",
-        "devops": [
-            "GitOps with Argo",
-            "Progressive delivery with Flagger",
-            "CLIs for multi-tenant ops",
-        ],
-        "integration": [
-            "Cloud marketplaces",
-            "CI/CD tooling",
-            "Developer analytics",
-        ],
-    },
-    "Marketing": {
-        "architecture": "Channel intelligence graph with experimentation and attribution layers",
-        "stack": [
-            "Python services",
-            "Next.js marketing workbench",
-            "PostgreSQL + DuckDB",
-            "Airflow / dbt",
-            "Reverse ETL (Hightouch)",
-        ],
-        "ai": [
-            "Campaign narrative generator",
-            "Creative brief assistant",
-            "Attribution explainer agent",
-        ],
-        "service": [
-            "Segment harmoniser",
-            "Experiment launcher",
-            "Insights studio",
-        ],
-        "data": "Blend paid, owned, and earned channel data with privacy-aware segmentation.",
-        "devops": [
-            "IaC with Terraform",
-            "Data quality monitors",
-            "Automated backtesting",
-        ],
-        "integration": [
-            "Ad platforms",
-            "CRM & marketing automation",
-            "Revenue systems",
-        ],
-    },
-    "Sustainability": {
-        "architecture": "Impact data backbone with scenario modelling engine",
-        "stack": [
-            "Python services",
-            "React + D3 visual stories",
-            "PostgreSQL + Timescale",
-            "Airflow sustainability pipelines",
-            "Vector store for ESG policies",
-        ],
-        "ai": [
-            "Carbon hotspot detection agent",
-            "ESG report drafter",
-            "Supplier classification assistant",
-        ],
-        "service": [
-            "Emission data ingestion",
-            "Target planning studio",
-            "Partner marketplace",
-        ],
-        "data": "Aggregate scope 1-3 data sources with provenance tracking and assurance.",
-        "devops": [
-            "Terraform + Vault",
-            "Automated assurance tests",
-            "Forecast monitoring",
-        ],
-        "integration": [
-            "ERP systems",
-            "Supply chain data feeds",
-            "Offset registries",
-        ],
-    },
-    "Industry": {
-        "architecture": "Edge-aware industrial platform with digital twin and predictive loop",
-        "stack": [
-            "Go / Rust edge services",
-            "FastAPI control plane",
-            "Time-series DB (Influx / Timescale)",
-            "Event backbone via Kafka",
-            "Lakehouse on Delta",
-        ],
-        "ai": [
-            "Predictive maintenance agents",
-            "Anomaly root-cause analysis",
-            "Production optimisation co-pilot",
-        ],
-        "service": [
-            "Asset registry",
-            "Work order automation",
-            "Supplier orchestration",
-        ],
-        "data": "Sync edge telemetry into secure lakehouse with lineage and replay.",
-        "devops": [
-            "Infrastructure automation",
-            "Blue/green for edge updates",
-            "Site reliability playbooks",
-        ],
-        "integration": [
-            "MES/SCADA",
-            "ERP & PLM",
-            "Quality management systems",
-        ],
-    },
-    "Innovation": {
-        "architecture": "Multi-agent orchestration fabric with shared knowledge graph and event bus",
-        "stack": [
-            "FastAPI orchestrators",
-            "React + Radix UI",
-            "PostgreSQL + pgvector",
-            "LangChain or LlamaIndex",
-            "Temporal for workflow choreography",
-        ],
-        "ai": [
-            "Persona-specific ideation agents",
-            "Blueprint synthesiser",
-            "Risk/assumption tracker",
-        ],
-        "service": [
-            "Idea ingestion",
-            "Narrative engine",
-            "Metrics cockpit",
-        ],
-        "data": "Maintain living product knowledge graph with traceable rationale and embeddings.",
-        "devops": [
-            "IaC with Terraform",
-            "Feature flags + experimentation",
-            "Observability (OpenTelemetry, Grafana)",
-        ],
-        "integration": [
-            "Product analytics",
-            "CRM & pipeline",
-            "Documentation hubs",
-        ],
-    },
-}
 
-DESIGN_TEMPLATES: Dict[str, Dict[str, object]] = {
-    "Healthcare": {
-        "principles": [
-            "Empathetic clarity with clinician-first language",
-            "Trust signals via audit trails and explainability",
-            "Assistive automation that keeps humans in control",
-        ],
-        "key_screens": [
-            "Clinical opportunity map",
-            "Compliance command centre",
-            "Patient impact dashboard",
-            "Care pathway timeline",
-        ],
-        "interaction": [
-            "Guided playbooks with safety checkpoints",
-            "Evidence trace overlays",
-            "Scenario comparison mode",
-        ],
-        "voice": "Reassuring, expert, compliance-aware",
-        "visual": "Calming neutrals with Akcero blue accents and data-rich panels",
-        "tone": "Evidence-led storytelling that balances innovation with safety",
-    },
-    "Finance": {
-        "principles": [
-            "Control and auditability",
-            "Scenario thinking at a glance",
-            "Signal prioritisation for analysts",
-        ],
-        "key_screens": [
-            "Risk cockpit",
-            "Regulatory action log",
-            "Portfolio automation canvas",
-            "Executive reporting suite",
-        ],
-        "interaction": [
-            "Explainable AI drilldowns",
-            "Playbook builder",
-            "Threshold alert designer",
-        ],
-        "voice": "Trusted, precise, and accountability-driven",
-        "visual": "High-contrast dashboards with precise typography and data density",
-        "tone": "Commanding confidence while highlighting safeguards",
-    },
-    "Education": {
-        "principles": [
-            "Guided creation with playful clarity",
-            "Community feedback loops",
-            "Celebration of learner progress",
-        ],
-        "key_screens": [
-            "Curriculum atelier",
-            "Learner journey mapper",
-            "Engagement analytics",
-            "Credential showcase",
-        ],
-        "interaction": [
-            "Commentary threads",
-            "Interactive storyboards",
-            "Adaptive preview",
-        ],
-        "voice": "Encouraging, human, future-positive",
-        "visual": "Warm neutrals with energetic accent gradients",
-        "tone": "Inspiring craftsmanship with practical scaffolding",
-    },
-    "Commerce": {
-        "principles": [
-            "Conversion clarity",
-            "Revenue storytelling",
-            "Fast iteration loops",
-        ],
-        "key_screens": [
-            "Revenue command centre",
-            "Experiment tracker",
-            "Marketplace health",
-            "Customer journey heatmap",
-        ],
-        "interaction": [
-            "Scenario toggles",
-            "Smart playbook suggestions",
-            "Live funnel overlays",
-        ],
-        "voice": "Energetic, growth-minded, and data-backed",
-        "visual": "Bold hero stats with modular cards and high-contrast calls-to-action",
-        "tone": "Outcome-obsessed yet grounded in feasibility",
-    },
-    "Productivity": {
-        "principles": [
-            "Narrative alignment",
-            "Transparency of agent decisions",
-            "Momentum cues",
-        ],
-        "key_screens": [
-            "Unified mission brief",
-            "Dependency radar",
-            "AI assistant timeline",
-            "Insights backlog",
-        ],
-        "interaction": [
-            "Command palette",
-            "Timeline scrubber",
-            "Focus mode",
-        ],
-        "voice": "Strategic, energising, partner-like",
-        "visual": "Layered cards, subtle glassmorphism, and rich whitespace",
-        "tone": "Confident acceleration without overwhelm",
-    },
-    "Customer": {
-        "principles": [
-            "Empathy showcased by design",
-            "Signal-to-action mapping",
-            "Moments of celebration for wins",
-        ],
-        "key_screens": [
-            "Customer health overview",
-            "Journey timeline",
-            "Executive briefing suite",
-            "Renewal planner",
-        ],
-        "interaction": [
-            "Success pulse checks",
-            "Playbook branching",
-            "Collaboration co-editing",
-        ],
-        "voice": "Supportive, pragmatic, north-star oriented",
-        "visual": "Soft gradients with crisp data cards and personable iconography",
-        "tone": "Empathetic authority that rallies teams",
-    },
-    "Developer": {
-        "principles": [
-            "Make power visible",
-            "Surfacing telemetry without noise",
-            "Shortcut-first execution",
-        ],
-        "key_screens": [
-            "Service topology",
-            "Usage analytics",
-            "API playground",
-            "Incident retros",
-        ],
-        "interaction": [
-            "Command palette + CLI parity",
-            "Split-pane diff view",
-            "Automations panel",
-        ],
-        "voice": "Direct, expert, builder-to-builder",
-        "visual": "Dark theme with neon accents and monospace highlights",
-        "tone": "Matter-of-fact, unlocking mastery and velocity",
-    },
-    "Marketing": {
-        "principles": [
-            "Narrative framing of data",
-            "Experiment storytelling",
-            "Collaboration rituals",
-        ],
-        "key_screens": [
-            "Campaign studio",
-            "Audience intelligence",
-            "Budget orchestration",
-            "Launch calendar",
-        ],
-        "interaction": [
-            "What-if toggles",
-            "Creative inspiration wall",
-            "Auto-generated executive briefs",
-        ],
-        "voice": "Bold, visionary, momentum-building",
-        "visual": "Vibrant gradient washes with crisp typography and video-friendly layouts",
-        "tone": "Ambitious with proof at every step",
-    },
-    "Sustainability": {
-        "principles": [
-            "Transparency",
-            "Collaborative accountability",
-            "Hopeful pragmatism",
-        ],
-        "key_screens": [
-            "Impact dashboard",
-            "Target tracking",
-            "Supplier alignment space",
-            "Investor-ready narrative",
-        ],
-        "interaction": [
-            "Scenario sliders",
-            "Compliance checklists",
-            "Goal visualisations",
-        ],
-        "voice": "Purposeful, optimistic, evidence-rich",
-        "visual": "Earthy neutrals with crisp data overlays and optimism cues",
-        "tone": "Inspiring urgency backed by action",
-    },
-    "Industry": {
-        "principles": [
-            "Operational clarity",
-            "Proactive alerts",
-            "Human + machine partnership",
-        ],
-        "key_screens": [
-            "Factory digital twin",
-            "Maintenance planner",
-            "Supply chain monitor",
-            "Executive value cockpit",
-        ],
-        "interaction": [
-            "Drill-through timelines",
-            "Command centre quick actions",
-            "Augmented reality overlays (roadmap)",
-        ],
-        "voice": "Assured, precision-focused, efficiency obsessed",
-        "visual": "High-contrast industrial UI with data-rich modules",
-        "tone": "Operationally authoritative with clear ROI",
-    },
-    "Innovation": {
-        "principles": [
-            "Story-driven intelligence",
-            "Actionable transparency",
-            "Momentum you can feel",
-        ],
-        "key_screens": [
-            "Idea intake cockpit",
-            "Opportunity canvas",
-            "Blueprint narrative board",
-            "Roadmap scenario explorer",
-        ],
-        "interaction": [
-            "Multiplayer editing",
-            "Timeline scrubbing",
-            "Agent rationale reveals",
-        ],
-        "voice": "Visionary, expert, energising",
-        "visual": "Luminous blues with clean glassmorphism and statement typography",
-        "tone": "Confident storytelling that rallies investors and teams",
-    },
-}
+class BusinessTemplate(NamedTuple):
+    """Commercial defaults for a domain category."""
 
-MARKET_TEMPLATES: Dict[str, Dict[str, object]] = {
-    "Healthcare": {
-        "segment": "Healthcare innovators seeking compliant AI copilots for faster validation",
-        "competitors": [
-            "Notable Health",
-            "Abridge",
-            "Kahun",
-        ],
-        "differentiators": [
-            "Multi-agent workflow tuned for clinical governance",
-            "Explainable narratives linked to compliance artifacts",
-            "Out-of-the-box audit telemetry",
-        ],
-        "personas": [
-            "Chief Innovation Officer",
-            "Clinical transformation lead",
-            "Digital health startup founder",
-        ],
-        "channels": [
-            "Healthcare innovation forums",
-            "Regulatory roundtables",
-            "Clinical podcast circuit",
-        ],
-        "challenges": [
-            "Procurement scrutiny around data residency",
-            "Proof of clinical efficacy required",
-        ],
-        "positioning": "Akcero turns fragmented clinical ideas into rigorously governed product blueprints in days, not quarters.",
-        "launch": "Secure lighthouse health systems, publish de-identified case outcomes, and host a compliance-focused launch webinar.",
-    },
-    "Finance": {
-        "segment": "Fintech and financial ops teams pursuing supervised AI automation",
-        "competitors": [
-            "Veryfi",
-            "OpenRisk",
-            "Canoe Intelligence",
-        ],
-        "differentiators": [
-            "Continuous compliance baked into agent workflows",
-            "Decision trails for auditors",
-            "Real-time scenario modelling",
-        ],
-        "personas": [
-            "Head of Operations",
-            "Chief Risk Officer",
-            "Fintech founder",
-        ],
-        "channels": [
-            "Fintech accelerators",
-            "RegTech conferences",
-            "LinkedIn thought leadership series",
-        ],
-        "challenges": [
-            "Regulatory approval timelines",
-            "Risk-averse buyers demand references",
-        ],
-        "positioning": "Akcero delivers supervised AI blueprints that pass risk and compliance checks without slowing product velocity.",
-        "launch": "Co-host sandbox demos with regulators and publish risk-case tear-downs showing measurable ROI.",
-    },
-    "Education": {
-        "segment": "Edtech builders modernising curriculum and learner engagement with AI",
-        "competitors": [
-            "Instructure AI",
-            "Knewton",
-            "Sana",
-        ],
-        "differentiators": [
-            "Human-first storytelling for instructors",
-            "Agent collaboration tuned for learning design",
-            "Embedded metrics for outcomes and equity",
-        ],
-        "personas": [
-            "Academic innovation dean",
-            "Program director",
-            "Learning design lead",
-        ],
-        "channels": [
-            "Edtech communities",
-            "Teacher influencer partnerships",
-            "Conference workshops",
-        ],
-        "challenges": [
-            "Budget cycles and accreditation",
-            "Need to prove learner impact quickly",
-        ],
-        "positioning": "Akcero helps educators ship future-proof programs with agents that co-design, validate, and measure learning impact.",
-        "launch": "Curate design partner cohort across universities and publish before/after learner stories.",
-    },
-    "Commerce": {
-        "segment": "Commerce operators chasing conversion breakthroughs with AI-led planning",
-        "competitors": [
-            "Triple Whale",
-            "Malomo",
-            "Shopify Sidekick",
-        ],
-        "differentiators": [
-            "Multi-agent GTM orchestrations",
-            "Narratives linking conversion gains to roadmap",
-            "Real-time marketplace telemetry",
-        ],
-        "personas": [
-            "VP Growth",
-            "Head of Merchandising",
-            "Founder / operator",
-        ],
-        "channels": [
-            "DTC communities",
-            "Performance marketing podcasts",
-            "Product Hunt launch",
-        ],
-        "challenges": [
-            "Crowded tooling category",
-            "Proof required on conversion lift",
-        ],
-        "positioning": "Akcero transforms raw commerce ideas into conversion-maximising blueprints orchestrated by specialised agents.",
-        "launch": "Partner with 3 flagship brands, televise experiment wins, and run joint launch live streams.",
-    },
-    "Productivity": {
-        "segment": "Product & strategy teams aligning cross-functional delivery",
-        "competitors": [
-            "Productboard",
-            "Aha!",
-            "Notion AI",
-        ],
-        "differentiators": [
-            "Agent swarm translating narrative to execution",
-            "Executive-ready storytelling",
-            "Telemetry that links decision to outcome",
-        ],
-        "personas": [
-            "Head of Product",
-            "Strategy lead",
-            "Chief of Staff",
-        ],
-        "channels": [
-            "Product leadership roundtables",
-            "Founder communities",
-            "Thought leadership newsletter",
-        ],
-        "challenges": [
-            "Need to reframe beyond classic roadmap tools",
-            "Stakeholder trust in AI decisions",
-        ],
-        "positioning": "Akcero's multi-agent studio makes every product idea investor, exec, and team ready in one collaborative motion.",
-        "launch": "Host live blueprint showcases with design partners and release template library on launch week.",
-    },
-    "Customer": {
-        "segment": "Customer success leaders scaling narrative-driven retention",
-        "competitors": [
-            "Gainsight AI",
-            "Catalyst",
-            "Vitally",
-        ],
-        "differentiators": [
-            "Blueprints connecting customer voice to roadmap",
-            "Executive-grade narratives auto-generated",
-            "Playbooks measured by revenue impact",
-        ],
-        "personas": [
-            "VP Customer Success",
-            "Revenue operations director",
-            "CS Ops lead",
-        ],
-        "channels": [
-            "CS leadership communities",
-            "Revenue forums",
-            "Webinars with customer heroes",
-        ],
-        "challenges": [
-            "Proving attribution to revenue",
-            "Integration expectations",
-        ],
-        "positioning": "Akcero turns customer signals into boardroom-ready blueprints that close renewals and expansions faster.",
-        "launch": "Run a lighthouse cohort with CS leaders, publish revenue turnaround stories, and launch on G2/Product Hunt.",
-    },
-    "Developer": {
-        "segment": "Platform and infrastructure leaders building AI-enabled tooling",
-        "competitors": [
-            "Vercel AI",
-            "Postman Intelligence",
-            "Buildkite Copilot",
-        ],
-        "differentiators": [
-            "Agentic design tailored for technical buyers",
-            "Traceable architecture narratives",
-            "CLI and API parity",
-        ],
-        "personas": [
-            "Head of Platform",
-            "Staff engineer",
-            "DevRel lead",
-        ],
-        "channels": [
-            "Open-source launches",
-            "Developer conferences",
-            "Technical AMAs",
-        ],
-        "challenges": [
-            "Need to prove reliability",
-            "Sophisticated buyer expectations",
-        ],
-        "positioning": "Akcero augments platform teams with agentic blueprints that ship resilient architecture and developer joy.",
-        "launch": "Release reference architectures, run live coding streams, and create integration challenges with partners.",
-    },
-    "Marketing": {
-        "segment": "Marketing leaders orchestrating AI-powered growth engines",
-        "competitors": [
-            "Jasper",
-            "Mutiny",
-            "June.so",
-        ],
-        "differentiators": [
-            "Narrative-first GTM agent collective",
-            "Attribution-aware action plans",
-            "Investor-ready storytelling",
-        ],
-        "personas": [
-            "Chief Marketing Officer",
-            "Growth director",
-            "Brand strategist",
-        ],
-        "channels": [
-            "CMO circles",
-            "Growth podcasts",
-            "Thought leadership reports",
-        ],
-        "challenges": [
-            "Saturation of AI copy tools",
-            "Need for proven attribution",
-        ],
-        "positioning": "Akcero architects growth engines that connect creative ambition to pipeline reality through specialised agents.",
-        "launch": "Release growth benchmark report, run joint webinars with design partners, and seed community challenges.",
-    },
-    "Sustainability": {
-        "segment": "Climate innovators and ESG leaders translating targets into action",
-        "competitors": [
-            "Watershed",
-            "Persefoni",
-            "Sweep",
-        ],
-        "differentiators": [
-            "Agent collective linking carbon data to product decisions",
-            "Investor-grade reporting narratives",
-            "Marketplace for certified partners",
-        ],
-        "personas": [
-            "Chief Sustainability Officer",
-            "Product sustainability lead",
-            "Impact entrepreneur",
-        ],
-        "channels": [
-            "Climate accelerators",
-            "ESG analyst forums",
-            "Impact investor networks",
-        ],
-        "challenges": [
-            "Data quality and proof of impact",
-            "Evolving regulations globally",
-        ],
-        "positioning": "Akcero compresses sustainability roadmapping from quarters to weeks with agentic rigor and measurable impact.",
-        "launch": "Publish impact scorecards with design partners and host a climate innovation summit.",
-    },
-    "Industry": {
-        "segment": "Industrial innovators digitising operations with AI co-pilots",
-        "competitors": [
-            "Sight Machine",
-            "Augury",
-            "GE Predix",
-        ],
-        "differentiators": [
-            "Agentic orchestration spanning plant to exec",
-            "Digital twin storytelling",
-            "Operational telemetry fused with product insights",
-        ],
-        "personas": [
-            "VP Operations",
-            "Digital transformation lead",
-            "Innovation lab head",
-        ],
-        "channels": [
-            "Industry consortiums",
-            "Manufacturing events",
-            "Public-private innovation programs",
-        ],
-        "challenges": [
-            "Lengthy procurement",
-            "Integration with legacy systems",
-        ],
-        "positioning": "Akcero accelerates industrial transformation with agentic blueprints that tie plant telemetry to board-level narratives.",
-        "launch": "Co-host factory innovation tours and publish ROI benchmarks with early adopters.",
-    },
-    "Innovation": {
-        "segment": "Founders and venture studios moving from concept to conviction",
-        "competitors": [
-            "Notion AI",
-            "Gamma",
-            "FigJam",
-        ],
-        "differentiators": [
-            "Six specialised agents collaborating in real-time",
-            "Investor-ready executive narrative",
-            "Proof loops that quantify traction",
-        ],
-        "personas": [
-            "Founder",
-            "Head of Product",
-            "Studio partner",
-        ],
-        "channels": [
-            "Founder communities",
-            "Product Hunt",
-            "Venture newsletters",
-        ],
-        "challenges": [
-            "Signal vs noise in AI tooling",
-            "Ensuring outcomes feel proprietary",
-        ],
-        "positioning": "Akcero makes every founder idea investor, customer, and team-ready through orchestrated AI agents.",
-        "launch": "Host live multi-agent blueprint showcases and publish the Akcero Product Builder playbook.",
-    },
+    model: str
+    pricing: str
+    revenue: Tuple[str, ...]
+    gtm: str
+    partners: Tuple[str, ...]
+    key_metrics: Tuple[str, ...]
+    enablement: Tuple[str, ...]
+    expansion: str
+
+
+class TechTemplate(NamedTuple):
+    """Reference architecture defaults for a domain category."""
+
+    architecture: str
+    stack: Tuple[str, ...]
+    ai: Tuple[str, ...]
+    service: Tuple[str, ...]
+    data: str
+    devops: Tuple[str, ...]
+    integration: Tuple[str, ...]
+
+
+class DesignTemplate(NamedTuple):
+    """Experience design defaults for a domain category."""
+
+    principles: Tuple[str, ...]
+    key_screens: Tuple[str, ...]
+    interaction: Tuple[str, ...]
+    voice: str
+    visual: str
+    tone: str
+
+
+class MarketTemplate(NamedTuple):
+    """Positioning and launch defaults for a domain category."""
+
+    segment: str
+    competitors: Tuple[str, ...]
+    differentiators: Tuple[str, ...]
+    personas: Tuple[str, ...]
+    channels: Tuple[str, ...]
+    challenges: Tuple[str, ...]
+    positioning: str
+    launch: str
+
+
+_TEMPLATE_TYPES = {
+    "business": BusinessTemplate,
+    "tech": TechTemplate,
+    "design": DesignTemplate,
+    "market": MarketTemplate,
 }
 
+TEMPLATES_PATH = Path(__file__).resolve().parent / "templates.json"
+
+
+def _freeze_field(value: object) -> object:
+    if isinstance(value, list):
+        return tuple(sys.intern(item) for item in value)
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _load_templates() -> Dict[str, Mapping[str, NamedTuple]]:
+    # Parsing the JSON blob is cheaper than compiling hundreds of literal lines when bytecode is not cached.
+    with TEMPLATES_PATH.open("r", encoding="utf-8") as handle:
+        raw = json.load(handle)
+    # Interned, read-only records so the memoized helpers can never observe a mutated template.
+    return {
+        family: MappingProxyType(
+            {
+                category: _TEMPLATE_TYPES[family](**{key: _freeze_field(value) for key, value in template.items()})
+                for category, template in templates.items()
+            }
+        )
+        for family, templates in raw.items()
+    }
+
+
+_TEMPLATES = _load_templates()
+
+BUSINESS_TEMPLATES: Mapping[str, BusinessTemplate] = _TEMPLATES["business"]
+TECH_TEMPLATES: Mapping[str, TechTemplate] = _TEMPLATES["tech"]
+DESIGN_TEMPLATES: Mapping[str, DesignTemplate] = _TEMPLATES["design"]
+MARKET_TEMPLATES: Mapping[str, MarketTemplate] = _TEMPLATES["market"]
+
 TIMELINE_NOTES: Dict[str, Dict[str, str]] = {
     "Healthcare": {
         "milestone": "Clinical advisory board validates pilot protocol",
@@ -1361,58 +368,247 @@ TIMELINE_NOTES: Dict[str, Dict[str, str]] = {
     },
 }
 
-TIMELINE_WINDOWS = {
-    "lean": ["Weeks 1-2", "Weeks 3-5", "Weeks 6-9", "Weeks 10-13", "Weeks 14-16"],
-    "standard": ["Weeks 1-3", "Weeks 4-7", "Weeks 8-13", "Weeks 14-18", "Weeks 19-22"],
-    "complex": ["Weeks 1-4", "Weeks 5-9", "Weeks 10-16", "Weeks 17-22", "Weeks 23-26"],
+
+class TimelineProfile(NamedTuple):
+    """Phase windows and total duration for a complexity tier."""
+
+    windows: Tuple[str, ...]
+    total: int
+
+
+TIMELINE_PROFILES: Mapping[str, TimelineProfile] = MappingProxyType(
+    {
+        "lean": TimelineProfile(("Weeks 1-2", "Weeks 3-5", "Weeks 6-9", "Weeks 10-13", "Weeks 14-16"), 16),
+        "standard": TimelineProfile(("Weeks 1-3", "Weeks 4-7", "Weeks 8-13", "Weeks 14-18", "Weeks 19-22"), 22),
+        "complex": TimelineProfile(("Weeks 1-4", "Weeks 5-9", "Weeks 10-16", "Weeks 17-22", "Weeks 23-26"), 26),
+    }
+)
+
+_PHASE_NAMES: Tuple[str, ...] = (
+    "Discovery & Insight Sprint",
+    "Experience Blueprinting",
+    "MVP Build & Instrumentation",
+    "Pilot & Iteration Loop",
+    "Launch & Scale Enablement",
+)
+
+_PHASE_OWNERS: Tuple[str, ...] = (
+    "Product discovery lead",
+    "Design + research squad",
+    "Engineering pod",
+    "Customer success & product marketing",
+    "Founding leadership & revenue ops",
+)
+
+# Only the {domain} slots vary per call; attribute notes are appended to these bases.
+_PHASE_FOCUS: Tuple[str, ...] = (
+    "Immerse with {domain} experts, surface pains, and quantify opportunity",
+    "Design signature {domain} experiences and validation flows",
+    "Build core services, harden data pipelines, and wire observability",
+    "Run closed pilots, harvest ROI metrics, and iterate narrative + pricing",
+    "Launch publicly, operationalise GTM motions, and ready scale infrastructure",
+)
+
+_PHASE_EXIT: Tuple[str, ...] = (
+    "Validated {domain} opportunity map and success metrics",
+    "Experience prototypes tested with priority personas",
+    "Production-ready MVP with telemetry + governance",
+    "Pilot cohort delivering quantified wins",
+    "Launch scorecard and next-wave backlog approved",
+)
+
+_BASE_MILESTONES: Tuple[str, ...] = (
+    "Narrative blueprint approved by executive sponsor",
+    "Pilot cohort signed with clear success metrics",
+    "AI reliability benchmarks achieved (>95% consistency)",
+    "Public launch with quantified customer stories",
+)
+
+BASE_VALUE_PROPS: Tuple[str, ...] = (
+    "Aligns multi-disciplinary teams around a shared product narrative",
+    "Transforms fuzzy concepts into execution-ready roadmaps",
+    "Surfaces market-ready differentiation in every deliverable",
+)
+
+CATEGORY_VALUE_PROPS: Dict[str, str] = {
+    "Healthcare": "Encodes compliance and patient safety considerations by default",
+    "Finance": "Highlights traceability and risk controls for regulated launch",
+    "Commerce": "Optimises conversion levers across the buying journey",
+    "Developer": "Provides deep technical architecture and integration playbooks",
+    "Marketing": "Maps campaigns to data-backed growth experiments",
+    "Sustainability": "Connects impact measurement to product delivery choices",
+}
+
+SUCCESS_METRICS: Dict[str, Tuple[str, ...]] = {
+    "Healthcare & Wellness": (
+        "Clinical validation achieved for top three use-cases",
+        "HIPAA-aligned data handling sign-off",
+    ),
+    "Finance & Fintech": (
+        "Regulatory review with compliance team completed",
+        "Pilot customers reach 20% workflow automation savings",
+    ),
+    "Education & Learning": (
+        "Learner engagement score above 75 NPS in pilot",
+        "Curriculum iteration cycle under two weeks",
+    ),
+    "Commerce & Retail": (
+        "Average order value uplift by 15% in beta cohort",
+        "Customer acquisition cost payback within three months",
+    ),
+    "Productivity & Collaboration": (
+        "Time-to-decision reduced by 30% across teams",
+        "Weekly active usage above 65% of invited members",
+    ),
+    "Customer Experience": (
+        "CSAT improvement of 10 points post-launch",
+        "First-response automation covering 40% of tickets",
+    ),
+    "Developer Tools": (
+        "Time-to-first-API-call under 5 minutes",
+        "95%+ reliability across key endpoints",
+    ),
+    "Marketing & Growth": (
+        "Pipeline contribution up 25%",
+        "Test velocity doubles without infrastructure debt",
+    ),
+    "Sustainability & Climate": (
+        "Verified carbon reduction milestone",
+        "Supply chain transparency index uplift",
+    ),
+    "Manufacturing & Industry": (
+        "Downtime reduced by 20% in pilot facilities",
+        "Yield and throughput improvements documented",
+    ),
+}
+
+DEFAULT_SUCCESS_METRICS: Tuple[str, ...] = (
+    "100 design partner sessions completed",
+    "Launch readiness scorecard signed off by leadership",
+)
+
+
+def _template_bundle(category: str) -> Mapping[str, object]:
+    return MappingProxyType(
+        {
+            "business": BUSINESS_TEMPLATES.get(category, BUSINESS_TEMPLATES["Innovation"]),
+            "tech": TECH_TEMPLATES.get(category, TECH_TEMPLATES["Innovation"]),
+            "design": DESIGN_TEMPLATES.get(category, DESIGN_TEMPLATES["Innovation"]),
+            "market": MARKET_TEMPLATES.get(category, MARKET_TEMPLATES["Innovation"]),
+            "timeline": TIMELINE_NOTES.get(category, TIMELINE_NOTES["Innovation"]),
+        }
+    )
+
+
+def _split_format(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    return tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+
+
+# GTM copy is rendered per request; parse each template's placeholders once at import.
+_GTM_PARTS: Dict[str, Tuple[Tuple[str, Optional[str]], ...]] = {
+    template.gtm: _split_format(template.gtm) for template in BUSINESS_TEMPLATES.values()
 }
 
-TIMELINE_TOTAL = {"lean": 16, "standard": 22, "complex": 26}
+
+# Keyed by the display domain so playbooks resolve every template family with one lookup.
+MERGED_TEMPLATES: Mapping[str, Mapping[str, object]] = MappingProxyType(
+    {domain: _template_bundle(category) for domain, category in DOMAIN_CATEGORY.items()}
+)
+
+
+def contains_casefold(needle: str, haystack: str) -> bool:
+    return needle.casefold() in haystack.casefold()
 
 
 def normalize(text: str) -> str:
-    return re.sub(r"\s+", " ", text.strip())
+    return _WHITESPACE_RE.sub(" ", text.strip())
+
+
+@lru_cache(maxsize=128)
+def _sentences(text: str) -> Tuple[str, ...]:
+    return tuple(sentence for chunk in _SENTENCE_BREAK_RE.split(text) if (sentence := normalize(chunk)))
 
 
 def tokenize_sentences(text: str) -> List[str]:
-    sentences = re.split(r"[.!?]\s+", text)
-    return [normalize(sentence) for sentence in sentences if normalize(sentence)]
+    return list(_sentences(text))
+
+
+def tokenize(text: str, lowered: Optional[str] = None) -> List[str]:
+    if lowered is None:
+        lowered = text.lower()
+    # Interned tokens hit the identity fast path against the literal STOPWORDS entries.
+    return [sys.intern(token) for token in _WORD_RE.findall(lowered)]
+
 
+@lru_cache(maxsize=128)
+def _ranked_keywords(lowered: str) -> Tuple[str, ...]:
+    ranking = Counter(w for w in tokenize(lowered, lowered) if len(w) > 2 and w not in STOPWORDS)
+    # Full most_common() ordering is stable, so any prefix equals most_common(limit).
+    return tuple(word for word, _ in ranking.most_common())
 
-def extract_keywords(text: str, limit: int = 8) -> List[str]:
-    words = re.findall(r"[a-zA-Z][a-zA-Z0-9-]+", text.lower())
-    filtered = [w for w in words if w not in STOPWORDS and len(w) > 2]
-    ranking = Counter(filtered)
-    keywords = [word for word, _ in ranking.most_common(limit)]
+
+def extract_keywords(text: str, limit: int = 8, lowered: Optional[str] = None) -> List[str]:
+    keywords = list(_ranked_keywords(text.lower() if lowered is None else lowered)[:limit])
     return keywords or ["innovation", "blueprint"]
 
 
+@lru_cache(maxsize=64)
 def resolve_category(domain: str) -> str:
-    return DOMAIN_CATEGORY.get(domain, domain.split("&")[0].strip() or "Innovation")
+    category = _domain_lookup(domain)
+    if category is None:
+        # Only derive a fallback for free-form domains outside the known display strings.
+        category = domain.split("&")[0].strip() or "Innovation"
+    return category
 
 
-def detect_attributes(text: str) -> Dict[str, bool]:
-    lowered = text.lower()
-    return {
-        name: any(keyword in lowered for keyword in keywords)
-        for name, keywords in ATTRIBUTE_KEYWORDS.items()
-    }
+@lru_cache(maxsize=64)
+def category_label(domain: str) -> str:
+    return resolve_category(domain).lower()
 
 
-def assess_complexity(text: str, attributes: Dict[str, bool] | None = None) -> str:
-    if attributes is None:
-        attributes = detect_attributes(text)
-    score = 1
-    for attr, active in attributes.items():
-        if not active:
-            continue
-        score += COMPLEXITY_WEIGHTS.get(attr, 1)
+def render_gtm(template: str, audience: str, domain: str) -> str:
+    values = {"audience": audience, "domain": domain}
+    parts = _GTM_PARTS.get(template) or _split_format(template)
+    pieces: List[str] = []
+    for literal, field in parts:
+        pieces.append(literal)
+        if field:
+            pieces.append(values[field])
+    return "".join(pieces)
+
+
+def get_templates(domain: str) -> Mapping[str, object]:
+    bundle = MERGED_TEMPLATES.get(domain)
+    if bundle is None:
+        bundle = _template_bundle(resolve_category(domain))
+    return bundle
+
+
+@lru_cache(maxsize=512)
+def _attribute_hits(lowered: str) -> frozenset[str]:
+    return frozenset(name for _, name in _ATTRIBUTE_AUTOMATON.iter(lowered))
+
+
+def detect_attributes(text: str, lowered: Optional[str] = None) -> Dict[str, bool]:
+    # The scan is cached; callers still get a fresh dict they are free to mutate.
+    hits = _attribute_hits(text.lower() if lowered is None else lowered)
+    return {name: name in hits for name in ATTRIBUTE_KEYWORDS}
+
+
+def _active_attributes(attributes: Dict[str, bool]) -> frozenset[str]:
+    return frozenset(name for name, active in attributes.items() if active)
+
+
+@lru_cache(maxsize=256)
+def _complexity_tier(text: str, active: frozenset[str]) -> str:
+    weight = _ATTRIBUTE_WEIGHTS.get
+    score = 1 + sum(weight(attr, 1) for attr in active)
     word_count = len(text.split())
     if word_count > 140:
         score += 1
     if word_count > 220:
         score += 1
-    if attributes.get("regulatory") and attributes.get("marketplace"):
+    if "regulatory" in active and "marketplace" in active:
         score += 1
     if score >= 6:
         return "complex"
@@ -1421,361 +617,269 @@ def assess_complexity(text: str, attributes: Dict[str, bool] | None = None) -> s
     return "lean"
 
 
-def infer_domain(text: str) -> str:
-    lowered = text.lower()
-    for domain, triggers in DOMAIN_CATEGORY.items():
-        # reuse mapping by checking keywords derived from category name
-        tokens = [token.strip().lower() for token in domain.replace("&", ",").split(",")]
-        if any(token in lowered for token in tokens):
-            return domain
-    return "Technology & Innovation"
-
-
-def infer_audience(text: str) -> str:
-    lowered = text.lower()
-    audience_map = {
-        "founder": "Founders and product leaders",
-        "startup": "Founders and product leaders",
-        "entrepreneur": "Founders and product leaders",
-        "operations": "Operations and strategy teams",
-        "strategy": "Operations and strategy teams",
-        "pm": "Product managers and discovery leads",
-        "enterprise": "Enterprise innovation teams",
-        "developer": "Developers and technical platform teams",
-        "engineer": "Developers and technical platform teams",
-        "marketing": "Growth and marketing leadership",
-        "growth": "Growth and marketing leadership",
-        "customer": "Customer success and revenue leaders",
-        "cs": "Customer success and revenue leaders",
-        "education": "Learning and enablement leaders",
-        "sustain": "Sustainability and impact leaders",
-    }
-    for keyword, audience in audience_map.items():
-        if keyword in lowered:
-            return audience
-    if "consumer" in lowered:
-        return "Design-forward consumers"
-    return "Visionary product builders"
+def assess_complexity(text: str, attributes: Dict[str, bool] | None = None) -> str:
+    if attributes is None:
+        attributes = detect_attributes(text)
+    return _complexity_tier(text, _active_attributes(attributes))
+
+
+@lru_cache(maxsize=1024)
+def _infer_domain(lowered: str) -> str:
+    return next(
+        (domain for trigger, domain in _DOMAIN_TRIGGERS if trigger in lowered),
+        "Technology & Innovation",
+    )
+
+
+def infer_domain(text: str, lowered: Optional[str] = None) -> str:
+    return _infer_domain(text.lower() if lowered is None else lowered)
+
+
+@lru_cache(maxsize=1024)
+def _infer_audience(lowered: str) -> str:
+    return _AUDIENCE_RULES.first(lowered, "Visionary product builders")
+
+
+def infer_audience(text: str, lowered: Optional[str] = None) -> str:
+    return _infer_audience(text.lower() if lowered is None else lowered)
 
 
 def craft_value_props(domain: str, audience: str) -> List[str]:
-    base = [
-        "Aligns multi-disciplinary teams around a shared product narrative",
-        "Transforms fuzzy concepts into execution-ready roadmaps",
-        "Surfaces market-ready differentiation in every deliverable",
-    ]
-    category = resolve_category(domain)
-    if category == "Healthcare":
-        base.append("Encodes compliance and patient safety considerations by default")
-    if category == "Finance":
-        base.append("Highlights traceability and risk controls for regulated launch")
-    if category == "Commerce":
-        base.append("Optimises conversion levers across the buying journey")
-    if category == "Developer":
-        base.append("Provides deep technical architecture and integration playbooks")
-    if category == "Marketing":
-        base.append("Maps campaigns to data-backed growth experiments")
-    if category == "Sustainability":
-        base.append("Connects impact measurement to product delivery choices")
+    props = list(BASE_VALUE_PROPS)
+    category_prop = CATEGORY_VALUE_PROPS.get(resolve_category(domain))
+    if category_prop:
+        props.append(category_prop)
     if "Enterprise" in audience:
-        base.append("Supports governance workflows and executive-ready reporting")
-    return base[:6]
+        props.append("Supports governance workflows and executive-ready reporting")
+    return props[:6]
 
 
 def derive_success_metrics(domain: str) -> List[str]:
-    mapping = {
-        "Healthcare & Wellness": [
-            "Clinical validation achieved for top three use-cases",
-            "HIPAA-aligned data handling sign-off",
-        ],
-        "Finance & Fintech": [
-            "Regulatory review with compliance team completed",
-            "Pilot customers reach 20% workflow automation savings",
-        ],
-        "Education & Learning": [
-            "Learner engagement score above 75 NPS in pilot",
-            "Curriculum iteration cycle under two weeks",
-        ],
-        "Commerce & Retail": [
-            "Average order value uplift by 15% in beta cohort",
-            "Customer acquisition cost payback within three months",
-        ],
-        "Productivity & Collaboration": [
-            "Time-to-decision reduced by 30% across teams",
-            "Weekly active usage above 65% of invited members",
-        ],
-        "Customer Experience": [
-            "CSAT improvement of 10 points post-launch",
-            "First-response automation covering 40% of tickets",
-        ],
-        "Developer Tools": [
-            "Time-to-first-API-call under 5 minutes",
-            "95%+ reliability across key endpoints",
-        ],
-        "Marketing & Growth": [
-            "Pipeline contribution up 25%",
-            "Test velocity doubles without infrastructure debt",
-        ],
-        "Sustainability & Climate": [
-            "Verified carbon reduction milestone",
-            "Supply chain transparency index uplift",
-        ],
-        "Manufacturing & Industry": [
-            "Downtime reduced by 20% in pilot facilities",
-            "Yield and throughput improvements documented",
-        ],
-    }
-    defaults = [
-        "100 design partner sessions completed",
-        "Launch readiness scorecard signed off by leadership",
-    ]
-    return mapping.get(domain, defaults) + ["Founders unlock clear investor-ready storytelling"]
-
-
-def get_business_playbook(
+    return [*SUCCESS_METRICS.get(domain, DEFAULT_SUCCESS_METRICS), "Founders unlock clear investor-ready storytelling"]
+
+
+def _extend_unique(base: Tuple[str, ...], extras: List[str]) -> List[str]:
+    # Template tuples are already unique, so only dedupe when attribute extras were added.
+    items = list(base)
+    if len(extras) == 1:
+        # A single extra is cheaper to check against the short template tuple than to hash into a set.
+        if extras[0] not in base:
+            items.append(extras[0])
+    elif extras:
+        seen = set(base)
+        for item in extras:
+            if item not in seen:
+                seen.add(item)
+                items.append(item)
+    return items
+
+
+@lru_cache(maxsize=256)
+def _business_playbook(
     domain: str,
     audience: str,
-    attributes: Dict[str, bool],
+    active: frozenset[str],
     complexity: str,
-    base_model: str | None = None,
-) -> Dict[str, object]:
-    category = resolve_category(domain)
-    template = BUSINESS_TEMPLATES.get(category, BUSINESS_TEMPLATES["Innovation"])
-    revenue = list(template["revenue"])
-    partners = list(template["partners"])
-    key_metrics = list(template["key_metrics"])
-    enablement = list(template["enablement"])
-    pricing_strategy = template["pricing"]
-    model = base_model or template["model"]
-    if base_model and base_model.lower() not in template["model"].lower():
-        model = f"{base_model} | {template['model']}"
-    go_to_market = template["gtm"].format(audience=audience, domain=domain.lower())
-    expansion_strategy = template["expansion"]
-    if attributes.get("marketplace"):
+    base_model: str | None,
+) -> Mapping[str, object]:
+    template = get_templates(domain)["business"]
+    revenue: List[str] = []
+    partners: List[str] = []
+    key_metrics: List[str] = []
+    enablement: List[str] = []
+    pricing_strategy = template.pricing
+    model = base_model or template.model
+    if base_model and not contains_casefold(base_model, template.model):
+        model = f"{base_model} | {template.model}"
+    go_to_market = render_gtm(template.gtm, audience, domain.lower())
+    expansion_strategy = template.expansion
+    if "marketplace" in active:
         revenue.append("Curated marketplace commissions and vendor sponsorships")
         go_to_market += " Recruit a dual-sided design partner cohort to validate supply-demand resonance."
-    if attributes.get("developer"):
+    if "developer" in active:
         revenue.append("Usage-based API tier with premium tooling bundles")
         enablement.append("Developer-first documentation and SDK launch kit")
-    if attributes.get("community"):
+    if "community" in active:
         revenue.append("Community membership and certification programs")
         go_to_market += " Launch ambassador-driven community drops and co-creation labs."
-    if attributes.get("regulatory"):
+    if "regulatory" in active:
         pricing_strategy += " Include compliance assurance fees for bespoke reviews."
         key_metrics.append("Regulatory milestone velocity")
-    if attributes.get("enterprise"):
+    if "enterprise" in active:
         partners.append("Enterprise enablement consultancies")
         enablement.append("Executive risk mitigation narrative")
-    key_metrics = list(dict.fromkeys(key_metrics))
-    revenue = list(dict.fromkeys(revenue))
-    partners = list(dict.fromkeys(partners))
-    enablement = list(dict.fromkeys(enablement))
-    return {
-        "model": model,
-        "pricing_strategy": pricing_strategy,
-        "revenue_streams": revenue,
-        "go_to_market": go_to_market,
-        "partners": partners,
-        "key_metrics": key_metrics,
-        "sales_enablement": enablement,
-        "expansion_strategy": expansion_strategy,
-        "complexity_profile": complexity.title(),
-    }
+    return _freeze_playbook(
+        {
+            "model": model,
+            "pricing_strategy": pricing_strategy,
+            "revenue_streams": _extend_unique(template.revenue, revenue),
+            "go_to_market": go_to_market,
+            "partners": _extend_unique(template.partners, partners),
+            "key_metrics": _extend_unique(template.key_metrics, key_metrics),
+            "sales_enablement": _extend_unique(template.enablement, enablement),
+            "complexity_profile": complexity.title(),
+            "expansion_strategy": expansion_strategy,
+        }
+    )
 
 
-def get_tech_playbook(domain: str, attributes: Dict[str, bool], complexity: str) -> Dict[str, object]:
-    category = resolve_category(domain)
-    template = TECH_TEMPLATES.get(category, TECH_TEMPLATES["Innovation"])
-    stack = list(template["stack"])
-    ai_components = list(template["ai"])
-    service_components = list(template["service"])
-    devops = list(template["devops"])
-    integration = list(template["integration"])
-    data_strategy = template["data"]
-    architecture = template["architecture"]
-    if attributes.get("realtime"):
+@lru_cache(maxsize=256)
+def _tech_playbook(domain: str, active: frozenset[str], complexity: str) -> Mapping[str, object]:
+    template = get_templates(domain)["tech"]
+    stack: List[str] = []
+    ai_components: List[str] = []
+    service_components: List[str] = []
+    devops: List[str] = []
+    integration: List[str] = []
+    data_strategy = template.data
+    architecture = template.architecture
+    complexity_title = complexity.title()
+    workload = category_label(domain)
+    if "realtime" in active:
         stack.append("Event streaming backbone (Kafka / Pulsar)")
         ai_components.append("Real-time signal prioritisation agent")
-    if attributes.get("marketplace"):
+    if "marketplace" in active:
         service_components.append("Supply-demand matching engine")
         ai_components.append("Marketplace liquidity forecaster")
-    if attributes.get("hardware"):
+    if "hardware" in active:
         stack.append("IoT ingestion via MQTT/Greengrass")
         service_components.append("Edge device fleet manager")
-    if attributes.get("mobile") and all("React Native" not in item for item in stack):
+    if "mobile" in active and all("React Native" not in item for item in (*template.stack, *stack)):
         stack.append("React Native / Expo mobile shell")
-    if attributes.get("developer"):
+    if "developer" in active:
         integration.append("CLI and SDK distribution pipeline")
         devops.append("Developer sandbox orchestration")
-    if attributes.get("enterprise"):
+    if "enterprise" in active:
         devops.append("Policy-as-code with Conftest / OPA")
-    integration = list(dict.fromkeys(integration))
-    devops = list(dict.fromkeys(devops))
-    service_components = list(dict.fromkeys(service_components))
-    return {
-        "architecture": architecture,
-        "stack": list(dict.fromkeys(stack)),
-        "ai_components": list(dict.fromkeys(ai_components)),
-        "service_components": service_components,
-        "data_strategy": data_strategy,
-        "devops": devops,
-        "integration_points": integration,
-        "resilience_notes": f"{complexity.title()} delivery profile with guardrails for {resolve_category(domain).lower()} workloads.",
-    }
+    return _freeze_playbook(
+        {
+            "architecture": architecture,
+            "stack": _extend_unique(template.stack, stack),
+            "ai_components": _extend_unique(template.ai, ai_components),
+            "service_components": _extend_unique(template.service, service_components),
+            "data_strategy": data_strategy,
+            "devops": _extend_unique(template.devops, devops),
+            "integration_points": _extend_unique(template.integration, integration),
+            "resilience_notes": f"{complexity_title} delivery profile with guardrails for {workload} workloads.",
+            "scalability": f"{complexity_title} delivery cadence with guardrails for {workload} workloads.",
+        }
+    )
 
 
-def get_design_palette(
+@lru_cache(maxsize=256)
+def _design_palette(
     domain: str,
     audience: str,
-    attributes: Dict[str, bool],
+    active: frozenset[str],
     complexity: str,
-) -> Dict[str, object]:
-    category = resolve_category(domain)
-    template = DESIGN_TEMPLATES.get(category, DESIGN_TEMPLATES["Innovation"])
-    principles = list(template["principles"])
-    key_screens = list(template["key_screens"])
-    interaction_patterns = list(template["interaction"])
-    brand_voice = template["voice"]
-    visual_language = template["visual"]
-    tone = template["tone"]
-    if attributes.get("developer"):
+) -> Mapping[str, object]:
+    template = get_templates(domain)["design"]
+    principles: List[str] = []
+    key_screens: List[str] = []
+    interaction_patterns: List[str] = []
+    brand_voice = template.voice
+    visual_language = template.visual
+    tone = template.tone
+    if "developer" in active:
         interaction_patterns.append("Keyboard-first power commands")
         principles.append("Expose system status for advanced users")
-    if attributes.get("regulatory"):
+    if "regulatory" in active:
         principles.append("Surface compliance guardrails contextually")
         interaction_patterns.append("Audit-ready export flows")
-    if attributes.get("marketplace"):
+    if "marketplace" in active:
         key_screens.append("Supply & demand orchestration board")
-    if attributes.get("community"):
+    if "community" in active:
         key_screens.append("Community pulse and ambassador missions")
     if "Enterprise" in audience:
         brand_voice = f"{brand_voice} with executive polish"
         tone = f"{tone}. Always tie outcomes to strategic imperatives."
-    principles = list(dict.fromkeys(principles))
-    key_screens = list(dict.fromkeys(key_screens))
-    interaction_patterns = list(dict.fromkeys(interaction_patterns))
-    return {
-        "experience_principles": principles,
-        "key_screens": key_screens,
-        "interaction_patterns": interaction_patterns,
-        "brand_voice": brand_voice,
-        "visual_language": visual_language,
-        "content_tone": tone,
-        "design_complexity": complexity.title(),
-    }
+    return _freeze_playbook(
+        {
+            "experience_principles": _extend_unique(template.principles, principles),
+            "key_screens": _extend_unique(template.key_screens, key_screens),
+            "interaction_patterns": _extend_unique(template.interaction, interaction_patterns),
+            "brand_voice": brand_voice,
+            "visual_language": visual_language,
+            "content_tone": tone,
+            "design_complexity": complexity.title(),
+        }
+    )
 
 
-def get_market_playbook(
+@lru_cache(maxsize=256)
+def _market_playbook(
     domain: str,
     audience: str,
-    attributes: Dict[str, bool],
+    active: frozenset[str],
     complexity: str,
-) -> Dict[str, object]:
-    category = resolve_category(domain)
-    template = MARKET_TEMPLATES.get(category, MARKET_TEMPLATES["Innovation"])
-    competitors = list(template["competitors"])
-    differentiators = list(template["differentiators"])
-    personas = list(template["personas"])
-    channels = list(template["channels"])
-    challenges = list(template["challenges"])
-    positioning = template["positioning"]
-    launch_strategy = template["launch"]
-    if attributes.get("marketplace"):
+) -> Mapping[str, object]:
+    template = get_templates(domain)["market"]
+    differentiators: List[str] = []
+    personas: List[str] = []
+    channels: List[str] = []
+    challenges: List[str] = []
+    positioning = template.positioning
+    launch_strategy = template.launch
+    if "marketplace" in active:
         differentiators.append("Orchestrates dual-sided market dynamics with agent intelligence")
         challenges.append("Need to balance supply and demand narratives early")
-    if attributes.get("regulatory"):
+    if "regulatory" in active:
         differentiators.append("Compliance telemetry wired into every blueprint")
-    if attributes.get("community"):
+    if "community" in active:
         channels.append("Community-led roundtables and ambassador streams")
-    if attributes.get("developer"):
+    if "developer" in active:
         personas.append("Lead platform engineer")
         channels.append("Open-source and developer relations campaigns")
-    competitors = list(dict.fromkeys(competitors))
-    differentiators = list(dict.fromkeys(differentiators))
-    channels = list(dict.fromkeys(channels))
-    challenges = list(dict.fromkeys(challenges))
-    personas = list(dict.fromkeys(personas))
-    return {
-        "segment": template["segment"],
-        "competitors": competitors,
-        "differentiators": differentiators,
-        "personas": personas,
-        "marketing_channels": channels,
-        "market_challenges": challenges,
-        "launch_strategy": launch_strategy,
-        "positioning_statement": positioning,
-        "go_to_market_intent": complexity.title(),
-    }
+    return _freeze_playbook(
+        {
+            "segment": template.segment,
+            "competitors": list(template.competitors),
+            "differentiators": _extend_unique(template.differentiators, differentiators),
+            "personas": _extend_unique(template.personas, personas),
+            "marketing_channels": _extend_unique(template.channels, channels),
+            "market_challenges": _extend_unique(template.challenges, challenges),
+            "launch_strategy": launch_strategy,
+            "positioning_statement": positioning,
+            "go_to_market_intent": complexity.title(),
+        }
+    )
 
 
-def get_timeline_blueprint(
-    domain: str,
-    attributes: Dict[str, bool],
-    complexity: str,
-) -> Dict[str, object]:
-    windows = TIMELINE_WINDOWS[complexity]
-    total_duration = TIMELINE_TOTAL[complexity]
+@lru_cache(maxsize=256)
+def _timeline_blueprint(domain: str, active: frozenset[str], complexity: str) -> Mapping[str, object]:
+    windows, total_duration = TIMELINE_PROFILES[complexity]
     domain_lower = domain.lower()
-    base_focus = [
-        f"Immerse with {domain_lower} experts, surface pains, and quantify opportunity",
-        f"Design signature {domain_lower} experiences and validation flows",
-        f"Build core services, harden data pipelines, and wire observability",
-        f"Run closed pilots, harvest ROI metrics, and iterate narrative + pricing",
-        f"Launch publicly, operationalise GTM motions, and ready scale infrastructure",
-    ]
-    base_exit = [
-        f"Validated {domain_lower} opportunity map and success metrics",
-        "Experience prototypes tested with priority personas",
-        "Production-ready MVP with telemetry + governance",
-        "Pilot cohort delivering quantified wins",
-        "Launch scorecard and next-wave backlog approved",
-    ]
-    owners = [
-        "Product discovery lead",
-        "Design + research squad",
-        "Engineering pod",
-        "Customer success & product marketing",
-        "Founding leadership & revenue ops",
-    ]
-    if attributes.get("regulatory"):
-        base_focus[0] += "; capture compliance constraints and stakeholders"
-        base_focus[2] += "; embed audit logging & access controls"
+    # Attribute notes are collected per phase and joined once instead of growing strings with +=.
+    focus_notes: List[List[str]] = [[focus.format(domain=domain_lower)] for focus in _PHASE_FOCUS]
+    base_exit = [exit_criteria.format(domain=domain_lower) for exit_criteria in _PHASE_EXIT]
+    if "regulatory" in active:
+        focus_notes[0].append("capture compliance constraints and stakeholders")
+        focus_notes[2].append("embed audit logging & access controls")
         base_exit[2] += " with compliance review sign-off"
-    if attributes.get("marketplace"):
-        base_focus[1] += "; map supply-demand personas and incentives"
-        base_focus[3] += "; balance both sides of the marketplace"
+    if "marketplace" in active:
+        focus_notes[1].append("map supply-demand personas and incentives")
+        focus_notes[3].append("balance both sides of the marketplace")
         base_exit[3] += " with dual-sided retention signals"
-    if attributes.get("hardware"):
-        base_focus[1] += "; align hardware/IoT roadmap"
-        base_focus[2] += "; integrate edge device telemetry"
-    if attributes.get("developer"):
-        base_focus[2] += "; expose APIs and CLI early"
-        base_focus[4] += "; launch developer advocacy runway"
-    notes = TIMELINE_NOTES.get(resolve_category(domain), TIMELINE_NOTES["Innovation"])
-    phases = []
-    phase_names = [
-        "Discovery & Insight Sprint",
-        "Experience Blueprinting",
-        "MVP Build & Instrumentation",
-        "Pilot & Iteration Loop",
-        "Launch & Scale Enablement",
-    ]
-    for idx, name in enumerate(phase_names):
-        phases.append(
-            {
-                "phase": name,
-                "duration": windows[idx],
-                "focus": base_focus[idx],
-                "owner": owners[idx],
-                "exit_criteria": base_exit[idx],
-            }
+    if "hardware" in active:
+        focus_notes[1].append("align hardware/IoT roadmap")
+        focus_notes[2].append("integrate edge device telemetry")
+    if "developer" in active:
+        focus_notes[2].append("expose APIs and CLI early")
+        focus_notes[4].append("launch developer advocacy runway")
+    notes = get_templates(domain)["timeline"]
+    phases = [
+        {
+            "phase": name,
+            "duration": window,
+            "focus": focus,
+            "owner": owner,
+            "exit_criteria": exit_criteria,
+        }
+        for name, window, focus, owner, exit_criteria in zip(
+            _PHASE_NAMES, windows, map("; ".join, focus_notes), _PHASE_OWNERS, base_exit
         )
-    milestones = [
-        "Narrative blueprint approved by executive sponsor",
-        "Pilot cohort signed with clear success metrics",
-        "AI reliability benchmarks achieved (>95% consistency)",
-        "Public launch with quantified customer stories",
     ]
+    milestones = list(_BASE_MILESTONES)
     milestone_note = notes.get("milestone")
     if milestone_note and milestone_note not in milestones:
         milestones.append(milestone_note)
@@ -1783,9 +887,79 @@ def get_timeline_blueprint(
         f"{complexity.title()} cadence with emphasis on {domain_lower} risk mitigation and momentum. "
         f"Launch focus: {notes.get('launch')}"
     )
-    return {
-        "phases": phases,
-        "total_duration_weeks": total_duration,
-        "milestones": milestones,
-        "cadence_notes": cadence_notes,
-    }
+    return _freeze_playbook(
+        {
+            "phases": phases,
+            "total_duration_weeks": total_duration,
+            "milestones": milestones,
+            "cadence_notes": cadence_notes,
+        }
+    )
+
+
+def _freeze(value: object) -> object:
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: object) -> object:
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+def _freeze_playbook(playbook: Dict[str, object]) -> Mapping[str, object]:
+    # Cached results are shared between callers, so store them read-only with tuple-valued lists.
+    return _freeze(playbook)  # type: ignore[return-value]
+
+
+def _copy_playbook(playbook: Mapping[str, object]) -> Dict[str, object]:
+    # Hand every caller its own dict and lists to mutate; strings are shared.
+    return _thaw(playbook)  # type: ignore[return-value]
+
+
+def get_business_playbook(
+    domain: str,
+    audience: str,
+    attributes: Dict[str, bool],
+    complexity: str,
+    base_model: str | None = None,
+) -> Dict[str, object]:
+    return _copy_playbook(
+        _business_playbook(domain, audience, _active_attributes(attributes), complexity, base_model)
+    )
+
+
+def get_tech_playbook(domain: str, attributes: Dict[str, bool], complexity: str) -> Dict[str, object]:
+    return _copy_playbook(_tech_playbook(domain, _active_attributes(attributes), complexity))
+
+
+def get_design_palette(
+    domain: str,
+    audience: str,
+    attributes: Dict[str, bool],
+    complexity: str,
+) -> Dict[str, object]:
+    return _copy_playbook(_design_palette(domain, audience, _active_attributes(attributes), complexity))
+
+
+def get_market_playbook(
+    domain: str,
+    audience: str,
+    attributes: Dict[str, bool],
+    complexity: str,
+) -> Dict[str, object]:
+    return _copy_playbook(_market_playbook(domain, audience, _active_attributes(attributes), complexity))
+
+
+def get_timeline_blueprint(
+    domain: str,
+    attributes: Dict[str, bool],
+    complexity: str,
+) -> Dict[str, object]:
+    return _copy_playbook(_timeline_blueprint(domain, _active_attributes(attributes), complexity))
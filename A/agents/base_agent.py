@@ -2,22 +2,65 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any, Dict
 
+import orjson
+
 
 class BaseAgent(ABC):
     """Abstract base class for all agents in the product builder pipeline."""
 
     name: str
+    response_cache_size = 32
 
     def __init__(self, name: str) -> None:
         self.name = name
+        self._responses: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._responses_lock = threading.Lock()
 
     @abstractmethod
     def run(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the agent with the provided payload and return structured data."""
 
+    @property
+    def deterministic(self) -> bool:
+        """Whether identical payloads always produce identical responses."""
+
+        return not getattr(self, "_llm_enabled", True)
+
+    def run_cached(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the agent, reusing the response to an identical earlier payload when deterministic."""
+
+        if not self.deterministic:
+            return self.run(payload)
+        key = _payload_key(payload)
+        with self._responses_lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        response = self.run(payload)
+        with self._responses_lock:
+            self._responses[key] = copy.deepcopy(response)
+            if len(self._responses) > self.response_cache_size:
+                self._responses.popitem(last=False)
+        return response
+
+
+def _payload_key(payload: Dict[str, Any]) -> str:
+    encoded = orjson.dumps(
+        payload,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
 
 AgentPayload = Dict[str, Any]
 AgentResponse = Dict[str, Any]
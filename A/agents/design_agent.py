@@ -14,6 +14,8 @@ from agents.agent_utils import (
 from agents.base_agent import BaseAgent
 from core.deps import LLMClient
 
+_INSPIRATION_PROMPT = "Suggest design inspiration references (1 sentence) mixing product and brand cues."
+
 
 class DesignAgent(BaseAgent):
     """Shapes the design direction based on the product vision and audience."""
@@ -21,13 +23,15 @@ class DesignAgent(BaseAgent):
     def __init__(self, llm: LLMClient) -> None:
         super().__init__(name="DesignAgent")
         self.llm = llm
+        self._llm_enabled = getattr(llm, "provider", "") != "stub"
 
     def run(self, payload: Dict[str, object]) -> Dict[str, object]:
         idea_context = payload.get("idea_context") or {}
         idea_text = (payload.get("idea") or "").strip()
-        domain = idea_context.get("domain") or infer_domain(idea_text)
-        audience = idea_context.get("target_audience") or infer_audience(idea_text)
-        attributes = idea_context.get("attributes") or detect_attributes(idea_text)
+        lowered = None if idea_context else idea_text.lower()
+        domain = idea_context.get("domain") or infer_domain(idea_text, lowered)
+        audience = idea_context.get("target_audience") or infer_audience(idea_text, lowered)
+        attributes = idea_context.get("attributes") or detect_attributes(idea_text, lowered)
         complexity = idea_context.get("execution_complexity") or assess_complexity(idea_text, attributes)
 
         palette = get_design_palette(domain, audience, attributes, complexity)
@@ -36,9 +40,9 @@ class DesignAgent(BaseAgent):
             "Blend Akcero's luminous minimalism with proven patterns from category-defining "
             f"{domain.lower()} products and high-trust productivity tools."
         )
-        if getattr(self.llm, "provider", "") != "stub":
+        if self._llm_enabled:
             llm_inspiration = self.llm.generate(
-                "Suggest design inspiration references (1 sentence) mixing product and brand cues.",
+                _INSPIRATION_PROMPT,
                 f"Domain: {domain}\nAudience: {audience}\nPrinciples: {palette['experience_principles']}\nAttributes: {attributes}",
                 max_tokens=120,
                 temperature=0.5,
@@ -17,6 +17,11 @@ from agents.agent_utils import (
 from agents.base_agent import BaseAgent
 from core.deps import LLMClient
 
+_SOLUTION_PROMPT = "Extract a crisp solution phrase for the concept."
+_NARRATIVE_PROMPT = (
+    "Craft a bold two-sentence product narrative emphasising problem-solution fit and audience impact."
+)
+
 
 class IdeaAgent(BaseAgent):
     """Derives the foundational understanding of the user's startup idea."""
@@ -24,6 +29,7 @@ class IdeaAgent(BaseAgent):
     def __init__(self, llm: LLMClient) -> None:
         super().__init__(name="IdeaAgent")
         self.llm = llm
+        self._llm_enabled = getattr(llm, "provider", "") != "stub"
 
     def _select_problem(self, sentences: List[str]) -> str:
         for sentence in sentences:
@@ -48,9 +54,9 @@ class IdeaAgent(BaseAgent):
         problem = self._select_problem(sentences)
 
         llm_hint = ""
-        if getattr(self.llm, "provider", "") != "stub":
+        if self._llm_enabled:
             llm_hint = self.llm.generate(
-                "Extract a crisp solution phrase for the concept.",
+                _SOLUTION_PROMPT,
                 idea,
                 max_tokens=120,
             )
@@ -61,12 +67,13 @@ class IdeaAgent(BaseAgent):
         )
         solution = self._select_solution(sentences, solution_hint)
 
-        domain = infer_domain(idea)
-        audience = infer_audience(idea)
-        keywords = extract_keywords(idea, limit=10)
+        lowered = idea.lower()
+        domain = infer_domain(idea, lowered)
+        audience = infer_audience(idea, lowered)
+        keywords = extract_keywords(idea, limit=10, lowered=lowered)
         value_props = craft_value_props(domain, audience)
         success_metrics = derive_success_metrics(domain)
-        attributes = detect_attributes(idea)
+        attributes = detect_attributes(idea, lowered)
         complexity = assess_complexity(idea, attributes)
         attribute_highlights = [
             label.replace("_", " ").title() for label, active in attributes.items() if active
@@ -78,9 +85,9 @@ class IdeaAgent(BaseAgent):
         ]
 
         narrative = ""
-        if getattr(self.llm, "provider", "") != "stub":
+        if self._llm_enabled:
             narrative = self.llm.generate(
-                "Craft a bold two-sentence product narrative emphasising problem-solution fit and audience impact.",
+                _NARRATIVE_PROMPT,
                 f"Problem: {problem}\nSolution: {solution}\nAudience: {audience}\nDomain: {domain}\nComplexity: {complexity}",
                 max_tokens=140,
                 temperature=0.5,
@@ -9,10 +9,16 @@ from agents.agent_utils import (
     detect_attributes,
     get_tech_playbook,
     infer_domain,
-    resolve_category,
 )
 from agents.base_agent import BaseAgent
-from core.deps import LLMClient
+from core.deps import LLMClient, LLMRequest
+
+_ARCHITECTURE_PROMPT = (
+    "Summarise the architecture in one vivid sentence that emphasises reliability and extensibility."
+)
+_RESILIENCE_PROMPT = (
+    "Provide one sentence on reliability and risk mitigation priorities for this architecture."
+)
 
 
 class TechAgent(BaseAgent):
@@ -21,60 +27,57 @@ class TechAgent(BaseAgent):
     def __init__(self, llm: LLMClient) -> None:
         super().__init__(name="TechAgent")
         self.llm = llm
+        self._llm_enabled = getattr(llm, "provider", "") != "stub"
 
     def run(self, payload: Dict[str, object]) -> Dict[str, object]:
+        idea_context = payload.get("idea_context") or {}
         idea_text = (payload.get("idea") or "").strip()
-        domain = str(payload.get("idea_context", {}).get("domain") or infer_domain(idea_text))
-        attributes = payload.get("idea_context", {}).get("attributes") or detect_attributes(idea_text)
-        complexity = (
-            payload.get("idea_context", {}).get("execution_complexity")
-            or assess_complexity(idea_text, attributes)
-        )
+        lowered = None if idea_context else idea_text.lower()
+        domain = str(idea_context.get("domain") or infer_domain(idea_text, lowered))
+        attributes = idea_context.get("attributes") or detect_attributes(idea_text, lowered)
+        complexity = idea_context.get("execution_complexity") or assess_complexity(idea_text, attributes)
 
         playbook = get_tech_playbook(domain, attributes, complexity)
 
         architecture_summary = playbook["architecture"]
         resilience_notes = playbook["resilience_notes"]
 
-        if getattr(self.llm, "provider", "") != "stub":
-            llm_architecture = self.llm.generate(
-                "Summarise the architecture in one vivid sentence that emphasises reliability and extensibility.",
-                (
-                    f"Architecture: {architecture_summary}\n"
-                    f"Stack: {', '.join(playbook['stack'])}\n"
-                    f"AI: {', '.join(playbook['ai_components'])}\n"
-                    f"Domain: {domain}\n"
-                    f"Complexity: {complexity}"
-                ),
-                max_tokens=140,
-                temperature=0.4,
-            ).strip()
+        if self._llm_enabled:
+            llm_architecture, llm_resilience = (
+                completion.strip()
+                for completion in self.llm.generate_many(
+                    [
+                        LLMRequest(
+                            _ARCHITECTURE_PROMPT,
+                            (
+                                f"Architecture: {architecture_summary}\n"
+                                f"Stack: {', '.join(playbook['stack'])}\n"
+                                f"AI: {', '.join(playbook['ai_components'])}\n"
+                                f"Domain: {domain}\n"
+                                f"Complexity: {complexity}"
+                            ),
+                            max_tokens=140,
+                            temperature=0.4,
+                        ),
+                        LLMRequest(
+                            _RESILIENCE_PROMPT,
+                            (
+                                f"Domain: {domain}\n"
+                                f"Complexity: {complexity}\n"
+                                f"Attributes: {attributes}\n"
+                                f"Current notes: {resilience_notes}"
+                            ),
+                            max_tokens=120,
+                            temperature=0.3,
+                        ),
+                    ]
+                )
+            )
             if llm_architecture:
                 architecture_summary = llm_architecture
-
-            llm_resilience = self.llm.generate(
-                "Provide one sentence on reliability and risk mitigation priorities for this architecture.",
-                (
-                    f"Domain: {domain}\n"
-                    f"Complexity: {complexity}\n"
-                    f"Attributes: {attributes}\n"
-                    f"Current notes: {resilience_notes}"
-                ),
-                max_tokens=120,
-                temperature=0.3,
-            ).strip()
             if llm_resilience:
                 resilience_notes = llm_resilience
 
-        scalability = (
-            f"{complexity.title()} delivery cadence with guardrails for {resolve_category(domain).lower()} workloads."
-        )
-
-        playbook.update(
-            {
-                "architecture": architecture_summary,
-                "resilience_notes": resilience_notes,
-                "scalability": scalability,
-            }
-        )
+        playbook["architecture"] = architecture_summary
+        playbook["resilience_notes"] = resilience_notes
         return playbook
@@ -13,6 +13,8 @@ from agents.agent_utils import (
 from agents.base_agent import BaseAgent
 from core.deps import LLMClient
 
+_RISK_PROMPT = "List the top risk or contingency to watch (1 sentence)."
+
 
 class TimelineAgent(BaseAgent):
     """Aggregates cross-agent insights into a time-phased roadmap."""
@@ -20,18 +22,20 @@ class TimelineAgent(BaseAgent):
     def __init__(self, llm: LLMClient) -> None:
         super().__init__(name="TimelineAgent")
         self.llm = llm
+        self._llm_enabled = getattr(llm, "provider", "") != "stub"
 
     def run(self, payload: Dict[str, object]) -> Dict[str, object]:
         idea_context = payload.get("idea_context") or {}
         business_context = payload.get("business_context") or {}
         tech_context = payload.get("tech_context") or {}
         idea_text = (payload.get("idea") or "").strip()
+        lowered = None if idea_context else idea_text.lower()
 
-        domain = idea_context.get("domain") or infer_domain(idea_text.lower())
-        attributes = idea_context.get("attributes") or detect_attributes(idea_text.lower())
+        domain = idea_context.get("domain") or infer_domain(idea_text, lowered)
+        attributes = idea_context.get("attributes") or detect_attributes(idea_text, lowered)
         complexity = (
             idea_context.get("execution_complexity")
-            or assess_complexity(idea_text.lower(), attributes)
+            or assess_complexity(idea_text, attributes)
         )
 
         timeline = get_timeline_blueprint(domain, attributes, complexity)
@@ -39,9 +43,9 @@ class TimelineAgent(BaseAgent):
         risk_notes = (
             "Monitor scope creep, data readiness, and stakeholder engagement across the orchestration."
         )
-        if getattr(self.llm, "provider", "") != "stub":
+        if self._llm_enabled:
             llm_risks = self.llm.generate(
-                "List the top risk or contingency to watch (1 sentence).",
+                _RISK_PROMPT,
                 f"Idea context: {idea_context}\nBusiness: {business_context}\nTech: {tech_context}\nAttributes: {attributes}",
                 max_tokens=80,
                 temperature=0.4,
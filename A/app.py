@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import tempfile
+import hashlib
+import json
+import os
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Coroutine, Dict, Optional, Tuple
+from typing import Any, Coroutine, Dict, List, Tuple
 
 import streamlit as st
 from dotenv import load_dotenv
@@ -22,7 +23,8 @@ from agents import (
 from core.umbrella_agent import UmbrellaAgent
 from core.deps import get_llm
 from core.schemas import ProductBlueprint
-from utils.report_generator import build_pdf
+from utils.labels import pretty_label
+from utils.report_generator import build_pdf_bytes
 from utils.storage import StorageManager, get_db
 from utils.theming import render_rich_card, set_page
 
@@ -45,11 +47,50 @@ SAMPLE_IDEA = (
 )
 
 
-@st.cache_resource(show_spinner=False)
-def init_services() -> Tuple[UmbrellaAgent, StorageManager]:
-    """Instantiate LLM, agents, umbrella orchestrator, and storage backend."""
+_HERO_HTML = """
+        <div class="akcero-hero">
+            <h1>Akcero AI Product Builder</h1>
+            <p>Go from raw idea to a multi-dimensional product blueprint crafted by a squad of specialist AI agents.
+            Capture the problem, model the business, architect the tech, and plan the launch in minutes.</p>
+            <div class="akcero-chip-row">
+                <span class="akcero-chip">IdeaAgent → Narrative Clarity</span>
+                <span class="akcero-chip">BusinessAgent → Monetization Strategy</span>
+                <span class="akcero-chip">TechAgent → Architecture Stack</span>
+                <span class="akcero-chip">DesignAgent → Signature UX</span>
+                <span class="akcero-chip">MarketAgent → Positioning Intel</span>
+                <span class="akcero-chip">TimelineAgent → Launch Roadmap</span>
+            </div>
+        </div>
+        """
+_SUMMARY_HTML = "<div class='akcero-summary'><strong>Executive Summary</strong><br/>{}</div>"
+_PITCH_HTML = "<div class='akcero-pitch'><strong>Elevator Pitch</strong><br/>{}</div>"
+_CARD_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("idea", "idea"),
+    ("business", "business_model"),
+    ("tech", "tech_stack"),
+    ("design", "ui_design"),
+    ("market", "market_analysis"),
+    ("timeline", "timeline"),
+)
+
+
+def _llm_config() -> Tuple[str, str]:
+    """Return a non-secret fingerprint of the API key and the configured model."""
+
+    api_key = os.getenv("OPENAI_API_KEY", "")
+    fingerprint = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12] if api_key else ""
+    return fingerprint, os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+
 
-    llm = get_llm()
+@st.cache_resource(show_spinner=False, max_entries=2)
+def init_services(key_fingerprint: str, model: str) -> Tuple[UmbrellaAgent, StorageManager]:
+    """Instantiate LLM, agents, umbrella orchestrator, and storage backend.
+
+    The cache is keyed on a fingerprint of the key rather than the key itself, so the
+    secret never lands in Streamlit's cache while rotating it still rebuilds the services.
+    """
+
+    llm = get_llm(os.getenv("OPENAI_API_KEY") if key_fingerprint else None, model)
     idea_agent = IdeaAgent(llm)
     business_agent = BusinessAgent(llm)
     tech_agent = TechAgent(llm)
@@ -93,6 +134,7 @@ async def _generate_blueprint(
     *,
     pitch_mode: bool,
     status_slots: Dict[str, Any],
+    summary_slot: Any,
 ) -> Dict[str, Any]:
     """Run the umbrella agent asynchronously with progress callbacks."""
 
@@ -109,12 +151,16 @@ async def _generate_blueprint(
         idea_text,
         pitch_mode=pitch_mode,
         callback=update,
+        summary_sink=summary_slot.write_stream,
     )
 
 
 def _run_async(coro: Coroutine[Any, Any, Any]) -> Any:
     """Run an asyncio coroutine with a safe fallback loop."""
 
+    # NOTE: a fresh loop per generation is intentional. The OpenAI client is synchronous and
+    # called from worker threads, so there is no loop-bound connection pool worth keeping
+    # warm, and a loop held in session state would never be closed.
     try:
         return asyncio.run(coro)
     except RuntimeError:
@@ -125,6 +171,13 @@ def _run_async(coro: Coroutine[Any, Any, Any]) -> Any:
             loop.close()
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_list_runs(_storage: StorageManager, limit: int) -> List[Dict[str, str]]:
+    """Read the run library through a short-lived cache; cleared whenever a run is saved."""
+
+    return _storage.list_runs(limit=limit)
+
+
 def _render_history(storage: StorageManager) -> None:
     """Display run history in the sidebar and allow loading previous results."""
 
@@ -132,52 +185,41 @@ def _render_history(storage: StorageManager) -> None:
         st.image("assets/logo.png", use_column_width=True)
         st.markdown("### Akcero AI Product Builder")
         st.caption("From Idea to Product.")
+        _render_run_library(storage)
 
-        history = storage.list_runs(limit=20)
-        if history:
-            options = {f"{entry['created_at'][:16]} — {entry['idea_text'][:60]}": entry["id"] for entry in history}
-            selection = st.selectbox(
-                "Run Library",
-                options=["- New Run -"] + list(options.keys()),
-                key="history_select",
-            )
-            if selection and selection != "- New Run -":
-                run_id = options[selection]
-                if st.session_state.get("loaded_run_id") != run_id:
-                    record = storage.get_run(run_id)
-                    if record:
-                        st.session_state["idea_input"] = record.get("idea_text", "")
-                        st.session_state["blueprint"] = record.get("blueprint")
-                        st.session_state["agents_output"] = record.get("agents_output")
-                        st.session_state["pitch_text"] = record.get("pitch", "")
-                        st.session_state["loaded_run_id"] = run_id
-                        st.session_state["latest_run_id"] = run_id
-                        st.experimental_rerun()
-        else:
-            st.caption("Your generated product blueprints will appear here.")
+
+@st.fragment
+def _render_run_library(storage: StorageManager) -> None:
+    """Run Library picker; browsing it reruns only this fragment until a run is loaded."""
+
+    history = _cached_list_runs(storage, 20)
+    if history:
+        options = {f"{entry['created_at'][:16]} — {entry['idea_text'][:60]}": entry["id"] for entry in history}
+        selection = st.selectbox(
+            "Run Library",
+            options=["- New Run -"] + list(options.keys()),
+            key="history_select",
+        )
+        if selection and selection != "- New Run -":
+            run_id = options[selection]
+            if st.session_state.get("loaded_run_id") != run_id:
+                record = storage.get_run(run_id)
+                if record:
+                    st.session_state["idea_input"] = record.get("idea_text", "")
+                    st.session_state["blueprint"] = record.get("blueprint")
+                    st.session_state["agents_output"] = record.get("agents_output")
+                    st.session_state["pitch_text"] = record.get("pitch", "")
+                    st.session_state["loaded_run_id"] = run_id
+                    st.session_state["latest_run_id"] = run_id
+                    st.rerun()
+    else:
+        st.caption("Your generated product blueprints will appear here.")
 
 
 def _render_hero() -> None:
     """Showcase the hero section with product positioning."""
 
-    st.markdown(
-        """
-        <div class="akcero-hero">
-            <h1>Akcero AI Product Builder</h1>
-            <p>Go from raw idea to a multi-dimensional product blueprint crafted by a squad of specialist AI agents.
-            Capture the problem, model the business, architect the tech, and plan the launch in minutes.</p>
-            <div class="akcero-chip-row">
-                <span class="akcero-chip">IdeaAgent → Narrative Clarity</span>
-                <span class="akcero-chip">BusinessAgent → Monetization Strategy</span>
-                <span class="akcero-chip">TechAgent → Architecture Stack</span>
-                <span class="akcero-chip">DesignAgent → Signature UX</span>
-                <span class="akcero-chip">MarketAgent → Positioning Intel</span>
-                <span class="akcero-chip">TimelineAgent → Launch Roadmap</span>
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
 
 
 def _display_cards(blueprint: ProductBlueprint) -> None:
@@ -187,28 +229,20 @@ def _display_cards(blueprint: ProductBlueprint) -> None:
         return
 
     columns = st.columns(2)
-    card_order = [
-        ("idea", blueprint.get("idea", {})),
-        ("business", blueprint.get("business_model", {})),
-        ("tech", blueprint.get("tech_stack", {})),
-        ("design", blueprint.get("ui_design", {})),
-        ("market", blueprint.get("market_analysis", {})),
-        ("timeline", blueprint.get("timeline", {})),
-    ]
-    for idx, (key, data) in enumerate(card_order):
+    for idx, (key, section) in enumerate(_CARD_SECTIONS):
+        data = blueprint.get(section, {})
         title, icon = AGENT_CARD_METADATA[key]
         formatted: Dict[str, Any] = {}
         if isinstance(data, dict):
             for k, v in data.items():
-                label = k.replace("_", " ").title()
-                formatted[label] = v
+                formatted[pretty_label(k)] = v
         column = columns[idx % 2]
         with column:
             render_rich_card(title, icon, formatted)
 
     summary = blueprint.get("summary", "")
     if summary:
-        st.markdown("<div class='akcero-summary'><strong>Executive Summary</strong><br/>{}</div>".format(summary), unsafe_allow_html=True)
+        st.markdown(_SUMMARY_HTML.format(summary), unsafe_allow_html=True)
 
 
 def _render_pitch(pitch_text: str) -> None:
@@ -216,13 +250,18 @@ def _render_pitch(pitch_text: str) -> None:
 
     if not pitch_text:
         return
-    st.markdown(
-        f"<div class='akcero-pitch'><strong>Elevator Pitch</strong><br/>{pitch_text}</div>",
-        unsafe_allow_html=True,
-    )
+    st.markdown(_PITCH_HTML.format(pitch_text), unsafe_allow_html=True)
     st.code(pitch_text)
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _blueprint_pdf(blueprint_key: str) -> bytes:
+    """Render the PDF for a serialised blueprint, reused across reruns until it changes."""
+
+    return build_pdf_bytes(json.loads(blueprint_key))
+
+
+@st.fragment
 def _render_cta_row(blueprint: ProductBlueprint, storage: StorageManager, pitch: str) -> None:
     """Display the CTA buttons for PDF download and saving runs."""
 
@@ -232,14 +271,8 @@ def _render_cta_row(blueprint: ProductBlueprint, storage: StorageManager, pitch:
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        tmp_path: Optional[Path] = None
         try:
-            tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf", dir=Path("storage"))
-            tmp_path = Path(tmp_file.name)
-            tmp_file.close()
-            build_pdf(blueprint, tmp_path)
-            with tmp_path.open("rb") as handle:
-                pdf_data = handle.read()
+            pdf_data = _blueprint_pdf(json.dumps(blueprint, default=str))
             st.download_button(
                 label="Download PDF",
                 data=pdf_data,
@@ -248,9 +281,6 @@ def _render_cta_row(blueprint: ProductBlueprint, storage: StorageManager, pitch:
             )
         except Exception as exc:
             st.error(f"Unable to prepare PDF: {exc}")
-        finally:
-            if tmp_path and tmp_path.exists():
-                tmp_path.unlink(missing_ok=True)
 
     with col2:
         if st.button("Save to Library", type="secondary"):
@@ -261,6 +291,7 @@ def _render_cta_row(blueprint: ProductBlueprint, storage: StorageManager, pitch:
                     blueprint,
                     pitch,
                 )
+                _cached_list_runs.clear()
                 st.session_state["latest_run_id"] = run_id
                 st.success("Blueprint saved to your library.")
             except Exception as exc:
@@ -270,7 +301,7 @@ def _render_cta_row(blueprint: ProductBlueprint, storage: StorageManager, pitch:
 def main() -> None:
     """Streamlit application entrypoint."""
 
-    umbrella, storage = init_services()
+    umbrella, storage = init_services(*_llm_config())
     _ensure_session_state()
     _render_history(storage)
 
@@ -299,7 +330,7 @@ def main() -> None:
         )
         if st.button("Use Sample Idea", type="secondary"):
             st.session_state["idea_input"] = SAMPLE_IDEA
-            st.experimental_rerun()
+            st.rerun()
 
     cta_col1, cta_col2 = st.columns([2.4, 1])
     with cta_col1:
@@ -330,6 +361,7 @@ def main() -> None:
             }
             for placeholder in status_map.values():
                 placeholder.info("Queued…")
+            summary_slot = st.empty()
 
             with st.spinner("Agents collaborating on your blueprint…"):
                 result = _run_async(
@@ -338,8 +370,11 @@ def main() -> None:
                         idea_text,
                         pitch_mode=st.session_state.get("pitch_mode", False),
                         status_slots=status_map,
+                        summary_slot=summary_slot,
                     )
                 )
+            # The streamed preview is replaced by the summary rendered with the cards below.
+            summary_slot.empty()
 
             blueprint: ProductBlueprint = result.get("blueprint", {})  # type: ignore[assignment]
             agents_output = result.get("agents", {})
@@ -351,6 +386,7 @@ def main() -> None:
 
             try:
                 run_id = storage.save_run(idea_text, agents_output, blueprint, pitch_text)
+                _cached_list_runs.clear()
                 st.session_state["latest_run_id"] = run_id
                 st.session_state["loaded_run_id"] = run_id
                 st.success("Fresh blueprint generated and saved to your library.")
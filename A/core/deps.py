@@ -3,14 +3,33 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Sequence
 
 try:
     from openai import OpenAI  # type: ignore
 except ImportError:  # pragma: no cover - optional dependency
     OpenAI = None  # type: ignore
 
+DEFAULT_MAX_CONCURRENCY = 6
+
+
+class LLMStreamInterrupted(RuntimeError):
+    """Raised by :meth:`LLMClient.stream` when the provider fails after partial output."""
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    """A single prompt queued for :meth:`LLMClient.generate_many`."""
+
+    system_prompt: str
+    prompt: str
+    temperature: float = 0.2
+    max_tokens: int = 512
+
 
 @dataclass
 class LLMClient:
@@ -19,6 +38,12 @@ class LLMClient:
     provider: str
     model: str
     client: Optional[object] = None
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    _slots: threading.BoundedSemaphore = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Agents call the provider from worker threads, so the cap is a thread-level semaphore.
+        self._slots = threading.BoundedSemaphore(max(1, self.max_concurrency))
 
     def generate(
         self,
@@ -32,15 +57,16 @@ class LLMClient:
 
         if self.provider == "openai" and self.client is not None:
             try:
-                response = self.client.chat.completions.create(  # type: ignore[attr-defined]
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+                with self._slots:
+                    response = self.client.chat.completions.create(  # type: ignore[attr-defined]
+                        model=self.model,
+                        messages=[
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": prompt},
+                        ],
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
                 message = response.choices[0].message.content  # type: ignore[index]
                 return (message or "").strip()
             except Exception:
@@ -48,10 +74,80 @@ class LLMClient:
                 pass
 
         # Default deterministic template output.
-        blueprint = (
-            f"{prompt.strip()}" if prompt.strip() else "No additional insights available."
+        return prompt.strip() or "No additional insights available."
+
+    def stream(
+        self,
+        system_prompt: str,
+        prompt: str,
+        *,
+        temperature: float = 0.2,
+        max_tokens: int = 512,
+    ) -> Iterator[str]:
+        """Yield the completion incrementally; non-streaming providers yield it in one piece.
+
+        A failure before any text falls back to :meth:`generate`; a failure after partial
+        output raises :class:`LLMStreamInterrupted` so callers never keep a truncated answer.
+        """
+
+        if self.provider == "openai" and self.client is not None:
+            emitted = False
+            try:
+                # The slot is held for the request and each chunk read, never across a yield,
+                # so a slow consumer does not starve other provider calls.
+                with self._slots:
+                    chunks = iter(
+                        self.client.chat.completions.create(  # type: ignore[attr-defined]
+                            model=self.model,
+                            messages=[
+                                {"role": "system", "content": system_prompt},
+                                {"role": "user", "content": prompt},
+                            ],
+                            temperature=temperature,
+                            max_tokens=max_tokens,
+                            stream=True,
+                        )
+                    )
+                while True:
+                    with self._slots:
+                        chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    delta = chunk.choices[0].delta.content if chunk.choices else None  # type: ignore[index]
+                    if delta:
+                        emitted = True
+                        yield delta
+            except Exception as exc:
+                if emitted:
+                    raise LLMStreamInterrupted("Provider stream failed mid-completion.") from exc
+                # Nothing has been shown yet, so fall back to a blocking completion below.
+            else:
+                if emitted:
+                    return
+
+        yield self.generate(
+            system_prompt,
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
         )
-        return blueprint
+
+    def generate_many(self, requests: Sequence[LLMRequest]) -> List[str]:
+        """Run independent prompts concurrently and return completions in request order."""
+
+        def _run(request: LLMRequest) -> str:
+            return self.generate(
+                request.system_prompt,
+                request.prompt,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+            )
+
+        if len(requests) < 2:
+            return [_run(request) for request in requests]
+        # Provider calls are network bound, so overlapping them removes the serial round-trips.
+        with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+            return list(pool.map(_run, requests))
 
 
 class DeterministicLLMStub(LLMClient):
@@ -70,22 +166,48 @@ class DeterministicLLMStub(LLMClient):
     ) -> str:
         context = prompt.strip() or "the provided concept"
         intent = (
-            system_prompt.splitlines()[0]
+            system_prompt.partition("\n")[0]
             if system_prompt
             else "General ideation guidance."
         )
         return f"System Intent: {intent}\nInsight: Focus on {context}."
 
 
-def get_llm() -> LLMClient:
+def _max_concurrency() -> int:
+    """Read AKCERO_MAX_CONCURRENCY, keeping the default when the value is not a positive integer."""
+
+    raw = os.getenv("AKCERO_MAX_CONCURRENCY", "")
+    if not raw:
+        return DEFAULT_MAX_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        warnings.warn(
+            f"Ignoring AKCERO_MAX_CONCURRENCY={raw!r}; using {DEFAULT_MAX_CONCURRENCY}.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return DEFAULT_MAX_CONCURRENCY
+    return value
+
+
+def get_llm(api_key: Optional[str] = None, model: Optional[str] = None) -> LLMClient:
     """Return an LLM client instance, preferring OpenAI when configured."""
 
-    api_key = os.getenv("OPENAI_API_KEY")
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
     if api_key and OpenAI is not None:
+        max_concurrency = _max_concurrency()
         try:
             client = OpenAI(api_key=api_key)
-            model = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
-            return LLMClient(provider="openai", model=model, client=client)
+            model = model or os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+            return LLMClient(
+                provider="openai",
+                model=model,
+                client=client,
+                max_concurrency=max_concurrency,
+            )
         except Exception:
             pass
 
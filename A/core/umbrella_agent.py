@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Callable, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from agents import (
     BusinessAgent,
@@ -13,11 +15,67 @@ from agents import (
     TechAgent,
     TimelineAgent,
 )
+from agents.agent_utils import (
+    assess_complexity,
+    detect_attributes,
+    infer_audience,
+    infer_domain,
+)
 from agents.base_agent import AgentPayload, AgentResponse
-from core.deps import LLMClient
+from core.deps import LLMClient, LLMRequest, LLMStreamInterrupted
 from core.schemas import ProductBlueprint
 
 ProgressCallback = Callable[[str, str], None]
+SummarySink = Callable[[Iterator[str]], str]
+
+# Streamed runs generate the pitch here rather than on the loop's default executor, so
+# closing the per-generation loop after an aborted stream does not wait for the pitch call.
+_PITCH_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="akcero-pitch")
+
+
+# (line template, agent output, field, selector): a slice joins the first N list items,
+# anything else is the default used when the field is missing.
+_SUMMARY_FIELDS: Tuple[Tuple[str, str, str, Any], ...] = (
+    ("Problem: {}", "idea", "problem", ""),
+    ("Solution: {}", "idea", "solution", ""),
+    ("Audience: {}", "idea", "target_audience", ""),
+    ("Complexity: {}", "idea", "execution_complexity", ""),
+    ("Value Props: {}", "idea", "value_propositions", slice(2)),
+    ("Business Model: {}", "business", "model", ""),
+    ("Pricing: {}", "business", "pricing_strategy", ""),
+    ("GTM: {}", "business", "go_to_market", ""),
+    ("Key Metrics: {}", "business", "key_metrics", slice(2)),
+    ("Tech Stack: {}", "tech", "stack", slice(None)),
+    ("Architecture: {}", "tech", "architecture", ""),
+    ("AI Edge: {}", "tech", "ai_components", slice(2)),
+    ("Design Focus: {}", "design", "experience_principles", slice(None)),
+    ("Market Segment: {}", "market", "segment", ""),
+    ("Competitors: {}", "market", "competitors", slice(None)),
+    ("Differentiators: {}", "market", "differentiators", slice(None)),
+    ("Positioning: {}", "market", "positioning_statement", ""),
+    ("Momentum: {}", "market", "momentum_notes", ""),
+    ("Launch Channels: {}", "market", "marketing_channels", slice(2)),
+    ("Timeline: {} weeks", "timeline", "total_duration_weeks", 0),
+    ("Cadence: {}", "timeline", "cadence_notes", ""),
+    ("Risk Watchlist: {}", "timeline", "risk_watchlist", ""),
+)
+
+
+def _speculative_context(idea_text: str) -> Optional[Dict[str, Any]]:
+    """Predict the idea_context fields the middle-stage agents read, using IdeaAgent's helpers."""
+
+    idea = idea_text.strip()
+    if not idea:
+        # IdeaAgent substitutes a default concept for empty input, so there is nothing to predict.
+        return None
+    lowered = idea.lower()
+    attributes = detect_attributes(idea, lowered)
+    return {
+        "domain": infer_domain(idea, lowered),
+        "target_audience": infer_audience(idea, lowered),
+        "attributes": attributes,
+        "execution_complexity": assess_complexity(idea, attributes),
+    }
 
 
 class UmbrellaAgent:
@@ -56,51 +114,74 @@ class UmbrellaAgent:
             callback(agent_name, "completed")
         return result
 
+    async def _run_middle_stage(
+        self,
+        idea_text: str,
+        idea_context: Dict[str, Any],
+        callback: Optional[ProgressCallback] = None,
+    ) -> Tuple[AgentResponse, AgentResponse, AgentResponse, AgentResponse]:
+        # Business, tech, design and market only read idea_context, so they fan out together.
+        payload = {"idea": idea_text, "idea_context": idea_context}
+        async with asyncio.TaskGroup() as group:
+            business_task = group.create_task(
+                self.run_agent("BusinessAgent", self.business_agent.run_cached, payload, callback)
+            )
+            tech_task = group.create_task(
+                self.run_agent("TechAgent", self.tech_agent.run_cached, payload, callback)
+            )
+            design_task = group.create_task(
+                self.run_agent("DesignAgent", self.design_agent.run_cached, payload, callback)
+            )
+            market_task = group.create_task(
+                self.run_agent("MarketAgent", self.market_agent.run_cached, payload, callback)
+            )
+        return (
+            business_task.result(),
+            tech_task.result(),
+            design_task.result(),
+            market_task.result(),
+        )
+
     async def build_blueprint(
         self,
         idea_text: str,
         *,
         pitch_mode: bool = False,
         callback: Optional[ProgressCallback] = None,
+        summary_sink: Optional[SummarySink] = None,
     ) -> Dict[str, Any]:
-        """Execute the hybrid orchestration pipeline and return collected outputs."""
+        """Execute the hybrid orchestration pipeline and return collected outputs.
 
-        payload: AgentPayload = {"idea": idea_text}
+        The middle-stage agents start alongside IdeaAgent on a predicted idea context and are
+        re-run if IdeaAgent disagrees; ``callback`` reports each agent once either way.
+        When ``summary_sink`` is given, it receives the executive summary as a token
+        stream on the calling thread and returns the full text it rendered.
+        """
 
-        idea_output = await self.run_agent(
-            "IdeaAgent", self.idea_agent.run, payload, callback
-        )
+        payload: AgentPayload = {"idea": idea_text}
 
-        step_two_payload = {"idea": idea_text, "idea_context": idea_output}
-        business_task = asyncio.create_task(
-            self.run_agent(
-                "BusinessAgent", self.business_agent.run, step_two_payload, callback
-            )
-        )
-        tech_task = asyncio.create_task(
-            self.run_agent(
-                "TechAgent", self.tech_agent.run, step_two_payload, callback
+        speculative_context = _speculative_context(idea_text)
+        if speculative_context is None:
+            idea_output = await self.run_agent(
+                "IdeaAgent", self.idea_agent.run_cached, payload, callback
             )
-        )
-        business_output, tech_output = await asyncio.gather(business_task, tech_task)
-
-        step_three_payload = {
-            "idea": idea_text,
-            "idea_context": idea_output,
-            "business_context": business_output,
-            "tech_context": tech_output,
-        }
-        design_task = asyncio.create_task(
-            self.run_agent(
-                "DesignAgent", self.design_agent.run, step_three_payload, callback
-            )
-        )
-        market_task = asyncio.create_task(
-            self.run_agent(
-                "MarketAgent", self.market_agent.run, step_three_payload, callback
-            )
-        )
-        design_output, market_output = await asyncio.gather(design_task, market_task)
+            middle_outputs = await self._run_middle_stage(idea_text, idea_output, callback)
+        else:
+            # The middle stage only reads the derived context fields, which are cheap to
+            # predict from the raw idea, so it runs alongside IdeaAgent instead of after it.
+            async with asyncio.TaskGroup() as group:
+                idea_task = group.create_task(
+                    self.run_agent("IdeaAgent", self.idea_agent.run_cached, payload, callback)
+                )
+                middle_task = group.create_task(
+                    self._run_middle_stage(idea_text, speculative_context, callback)
+                )
+            idea_output, middle_outputs = idea_task.result(), middle_task.result()
+            if any(idea_output.get(field) != value for field, value in speculative_context.items()):
+                # A wrong prediction re-runs the middle stage silently: those agents have
+                # already reported "completed", and the status panel should not step back.
+                middle_outputs = await self._run_middle_stage(idea_text, idea_output)
+        business_output, tech_output, design_output, market_output = middle_outputs
 
         timeline_payload = {
             "idea": idea_text,
@@ -111,17 +192,36 @@ class UmbrellaAgent:
             "market_context": market_output,
         }
         timeline_output = await self.run_agent(
-            "TimelineAgent", self.timeline_agent.run, timeline_payload, callback
+            "TimelineAgent", self.timeline_agent.run_cached, timeline_payload, callback
         )
 
-        summary_text = self._summarize(
-            idea_output,
-            business_output,
-            tech_output,
-            design_output,
-            market_output,
-            timeline_output,
-        )
+        # The summary and pitch prompts are independent, so pitch mode costs no extra round-trip.
+        requests = [
+            self._summary_request(
+                idea_output,
+                business_output,
+                tech_output,
+                design_output,
+                market_output,
+                timeline_output,
+            )
+        ]
+        if pitch_mode:
+            requests.append(
+                self._pitch_request(
+                    idea_output,
+                    business_output,
+                    tech_output,
+                    market_output,
+                    timeline_output,
+                )
+            )
+        if summary_sink is None:
+            completions = await asyncio.to_thread(self.llm.generate_many, requests)
+            summary_text = completions[0]
+            pitch_text = completions[1] if pitch_mode else ""
+        else:
+            summary_text, pitch_text = await self._stream_summary(requests, summary_sink)
 
         blueprint: ProductBlueprint = {
             "idea": idea_output,
@@ -133,12 +233,6 @@ class UmbrellaAgent:
             "summary": summary_text,
         }
 
-        pitch_text = (
-            self._build_pitch(blueprint)
-            if pitch_mode
-            else ""
-        )
-
         return {
             "blueprint": blueprint,
             "agents": {
@@ -152,7 +246,70 @@ class UmbrellaAgent:
             "pitch": pitch_text.strip(),
         }
 
-    def _summarize(
+    async def build_blueprints_batch(
+        self,
+        ideas: List[str],
+        *,
+        pitch_mode: bool = False,
+        callback: Optional[ProgressCallback] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run the pipeline for several ideas concurrently, returning results in input order."""
+
+        # Each idea advances through its own stages without waiting on the slowest idea, so
+        # the LLM backend sees every in-flight request of a stage at once.
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(
+                    self.build_blueprint(idea, pitch_mode=pitch_mode, callback=callback)
+                )
+                for idea in ideas
+            ]
+        return [task.result() for task in tasks]
+
+    async def _stream_summary(
+        self,
+        requests: List[LLMRequest],
+        summary_sink: SummarySink,
+    ) -> Tuple[str, str]:
+        # The pitch is submitted to the executor before the sink takes over this thread, so
+        # it generates while the summary tokens are being rendered.
+        pitch_future = None
+        if len(requests) > 1:
+            pitch_future = asyncio.get_running_loop().run_in_executor(
+                _PITCH_EXECUTOR, self.llm.generate_many, requests[1:]
+            )
+        summary = requests[0]
+        completed = False
+        try:
+            try:
+                summary_text = summary_sink(
+                    self.llm.stream(
+                        summary.system_prompt,
+                        summary.prompt,
+                        temperature=summary.temperature,
+                        max_tokens=summary.max_tokens,
+                    )
+                )
+            except LLMStreamInterrupted:
+                # The sink only holds a truncated preview; the stored summary comes from a
+                # complete (or stub) answer instead.
+                summary_text = await asyncio.to_thread(
+                    self.llm.generate,
+                    summary.system_prompt,
+                    summary.prompt,
+                    temperature=summary.temperature,
+                    max_tokens=summary.max_tokens,
+                )
+            completed = True
+        finally:
+            if not completed and pitch_future is not None:
+                # The sink raised (e.g. a Streamlit rerun mid-stream): drop the pitch so its
+                # outcome is discarded instead of reported as never retrieved.
+                pitch_future.cancel()
+        pitch_text = (await pitch_future)[0] if pitch_future is not None else ""
+        return summary_text.strip(), pitch_text
+
+    def _summary_request(
         self,
         idea: AgentResponse,
         business: AgentResponse,
@@ -160,8 +317,8 @@ class UmbrellaAgent:
         design: AgentResponse,
         market: AgentResponse,
         timeline: AgentResponse,
-    ) -> str:
-        """Generate executive summary text leveraging the configured LLM."""
+    ) -> LLMRequest:
+        """Build the executive summary prompt for the configured LLM."""
 
         prompt = (
             "Create a confident executive summary for the product blueprint. "
@@ -169,39 +326,36 @@ class UmbrellaAgent:
             "technical advantage, design POV, market positioning, and launch momentum. "
             "Cap the summary at 130 words."
         )
-        value_props = ", ".join(idea.get("value_propositions", [])[:2])
-        key_metrics = ", ".join(business.get("key_metrics", [])[:2])
-        channels = ", ".join(market.get("marketing_channels", [])[:2])
-        context = "\n".join(
-            [
-                f"Problem: {idea.get('problem', '')}",
-                f"Solution: {idea.get('solution', '')}",
-                f"Audience: {idea.get('target_audience', '')}",
-                f"Complexity: {idea.get('execution_complexity', '')}",
-                f"Value Props: {value_props}",
-                f"Business Model: {business.get('model', '')}",
-                f"Pricing: {business.get('pricing_strategy', '')}",
-                f"GTM: {business.get('go_to_market', '')}",
-                f"Key Metrics: {key_metrics}",
-                f"Tech Stack: {', '.join(tech.get('stack', []))}",
-                f"Architecture: {tech.get('architecture', '')}",
-                f"AI Edge: {', '.join(tech.get('ai_components', [])[:2])}",
-                f"Design Focus: {', '.join(design.get('experience_principles', []))}",
-                f"Market Segment: {market.get('segment', '')}",
-                f"Competitors: {', '.join(market.get('competitors', []))}",
-                f"Differentiators: {', '.join(market.get('differentiators', []))}",
-                f"Positioning: {market.get('positioning_statement', '')}",
-                f"Momentum: {market.get('momentum_notes', '')}",
-                f"Launch Channels: {channels}",
-                f"Timeline: {timeline.get('total_duration_weeks', 0)} weeks",
-                f"Cadence: {timeline.get('cadence_notes', '')}",
-                f"Risk Watchlist: {timeline.get('risk_watchlist', '')}",
-            ]
-        )
-        return self.llm.generate(prompt, context)
+        sources = {
+            "idea": idea,
+            "business": business,
+            "tech": tech,
+            "design": design,
+            "market": market,
+            "timeline": timeline,
+        }
+        lines = []
+        for template, source, key, selector in _SUMMARY_FIELDS:
+            if isinstance(selector, slice):
+                value = ", ".join(islice(sources[source].get(key, ()), selector.stop))
+            else:
+                value = sources[source].get(key, selector)
+            # Empty fields carry no signal for the model, so they are left out of the prompt.
+            if value == "":
+                continue
+            lines.append(template.format(value))
+        context = "\n".join(lines)
+        return LLMRequest(prompt, context)
 
-    def _build_pitch(self, blueprint: ProductBlueprint) -> str:
-        """Craft a 30-second elevator pitch from the blueprint data."""
+    def _pitch_request(
+        self,
+        idea: AgentResponse,
+        business: AgentResponse,
+        tech: AgentResponse,
+        market: AgentResponse,
+        timeline: AgentResponse,
+    ) -> LLMRequest:
+        """Build the 30-second elevator pitch prompt from the blueprint data."""
 
         prompt = (
             "Craft a 6 sentence elevator pitch highlighting the problem, "
@@ -209,16 +363,16 @@ class UmbrellaAgent:
             "and roadmap. Keep it upbeat and visionary."
         )
         context = (
-            f"Problem: {blueprint['idea']['problem']}\n"
-            f"Solution: {blueprint['idea']['solution']}\n"
-            f"Audience: {blueprint['idea']['target_audience']}\n"
-            f"Complexity: {blueprint['idea'].get('execution_complexity', '')}\n"
-            f"Business Model: {blueprint['business_model']['model']}\n"
-            f"Pricing: {blueprint['business_model'].get('pricing_strategy', '')}\n"
-            f"Tech: {', '.join(blueprint['tech_stack']['stack'])}\n"
-            f"Differentiator: {', '.join(blueprint['market_analysis']['differentiators'])}\n"
-            f"Positioning: {blueprint['market_analysis'].get('positioning_statement', '')}\n"
-            f"Momentum: {blueprint['market_analysis'].get('momentum_notes', '')}\n"
-            f"Roadmap: {blueprint['timeline']['total_duration_weeks']} week plan"
+            f"Problem: {idea['problem']}\n"
+            f"Solution: {idea['solution']}\n"
+            f"Audience: {idea['target_audience']}\n"
+            f"Complexity: {idea.get('execution_complexity', '')}\n"
+            f"Business Model: {business['model']}\n"
+            f"Pricing: {business.get('pricing_strategy', '')}\n"
+            f"Tech: {', '.join(tech['stack'])}\n"
+            f"Differentiator: {', '.join(market['differentiators'])}\n"
+            f"Positioning: {market.get('positioning_statement', '')}\n"
+            f"Momentum: {market.get('momentum_notes', '')}\n"
+            f"Roadmap: {timeline['total_duration_weeks']} week plan"
         )
-        return self.llm.generate(prompt, context, temperature=0.4, max_tokens=220)
+        return LLMRequest(prompt, context, temperature=0.4, max_tokens=220)
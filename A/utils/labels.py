@@ -0,0 +1,12 @@
+"""Display label helpers shared by the Streamlit and PDF renderers."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=512)
+def pretty_label(key: str) -> str:
+    """Turn a snake_case blueprint field name into a Title Case display label."""
+
+    return key.replace("_", " ").title()
@@ -3,26 +3,61 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict, Union
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 
+from utils.labels import pretty_label
+
 BRAND_BLUE = colors.HexColor("#0077FF")
 TEXT_COLOR = colors.HexColor("#0A0A0A")
 
 ASSETS_PATH = Path(__file__).resolve().parent.parent / "assets"
+# The header is drawn on every page, so the logo lookup happens once at import.
+_LOGO_FILE = str(ASSETS_PATH / "logo.png") if (ASSETS_PATH / "logo.png").exists() else None
+
+_SECTION_STYLE = ParagraphStyle(
+    "SectionTitle",
+    fontName="Helvetica-Bold",
+    fontSize=16,
+    textColor=BRAND_BLUE,
+    spaceAfter=6,
+)
+_BODY_STYLE = ParagraphStyle(
+    "BodyText",
+    fontName="Helvetica",
+    fontSize=11,
+    leading=14,
+    textColor=TEXT_COLOR,
+)
+_FOOTER_STYLE = ParagraphStyle(
+    "Footer",
+    fontName="Helvetica-Oblique",
+    fontSize=10,
+    alignment=1,
+    textColor=colors.grey,
+)
+
+
+@lru_cache(maxsize=1)
+def _logo_image() -> ImageReader:
+    """Decode the logo once per process; every PDF and page reuses the same reader."""
+
+    return ImageReader(BytesIO(Path(_LOGO_FILE).read_bytes()))
 
 
 def _build_header(c: canvas.Canvas, doc_width: float, doc_height: float) -> None:
-    logo_path = ASSETS_PATH / "logo.png"
-    if logo_path.exists():
-        c.drawImage(str(logo_path), inch, doc_height - inch * 1.5, width=120, height=40, mask="auto")
+    if _LOGO_FILE is not None:
+        c.drawImage(_logo_image(), inch, doc_height - inch * 1.5, width=120, height=40, mask="auto")
     c.setFillColor(BRAND_BLUE)
     c.setFont("Helvetica-Bold", 20)
     c.drawString(inch, doc_height - inch * 1.75, "Akcero AI Product Builder")
@@ -32,45 +67,48 @@ def _build_header(c: canvas.Canvas, doc_width: float, doc_height: float) -> None
     c.line(inch, doc_height - inch * 2.1, doc_width - inch, doc_height - inch * 2.1)
 
 
+def _draw_page_header(canvas_obj: canvas.Canvas, doc_obj: SimpleDocTemplate) -> None:
+    # Width plus margins is the page size, so the header uses A4 directly.
+    _build_header(canvas_obj, *A4)
+
+
 def _section_title(text: str) -> Paragraph:
-    style = ParagraphStyle(
-        "SectionTitle",
-        fontName="Helvetica-Bold",
-        fontSize=16,
-        textColor=BRAND_BLUE,
-        spaceAfter=6,
-    )
-    return Paragraph(text, style)
+    return Paragraph(text, _SECTION_STYLE)
 
 
 def _body_text(text: str) -> Paragraph:
-    style = ParagraphStyle(
-        "BodyText",
-        fontName="Helvetica",
-        fontSize=11,
-        leading=14,
-        textColor=TEXT_COLOR,
-    )
-    return Paragraph(text, style)
+    return Paragraph(text, _BODY_STYLE)
 
 
 def build_pdf(blueprint_json: Dict[str, object], out_path: Path) -> str:
     """Render the product blueprint into a polished PDF and return its path."""
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
+    _render_pdf(blueprint_json, str(out_path))
+    return str(out_path)
+
 
+def build_pdf_bytes(blueprint_json: Dict[str, object]) -> bytes:
+    """Render the product blueprint into an in-memory PDF and return its bytes."""
+
+    buffer = BytesIO()
+    _render_pdf(blueprint_json, buffer)
+    return buffer.getvalue()
+
+
+def _render_pdf(blueprint_json: Dict[str, object], target: Union[str, BinaryIO]) -> None:
     doc = SimpleDocTemplate(
-        str(out_path),
+        target,
         pagesize=A4,
         leftMargin=inch,
         rightMargin=inch,
         topMargin=inch * 1.8,
         bottomMargin=inch,
+        pageCompression=1,
     )
 
     story = []
 
-    styles = getSampleStyleSheet()
     summary = blueprint_json.get("summary", "")
     if summary:
         story.append(_section_title("Executive Summary"))
@@ -86,47 +124,35 @@ def build_pdf(blueprint_json: Dict[str, object], out_path: Path) -> str:
         ("Roadmap & Timeline", blueprint_json.get("timeline", {})),
     ]
 
+    append = story.append
     for title, data in sections:
-        story.append(_section_title(title))
+        append(_section_title(title))
         if isinstance(data, dict):
             for key, value in data.items():
-                label = key.replace("_", " ").title()
+                label = pretty_label(key)
                 if isinstance(value, list):
                     if value and isinstance(value[0], dict):
-                        bullets = []
-                        for entry in value:
-                            parts = [
-                                f"{inner_key.replace('_', ' ').title()}: {inner_value}"
+                        bullets = "<br/>".join(
+                            "• "
+                            + " | ".join(
+                                f"{pretty_label(inner_key)}: {inner_value}"
                                 for inner_key, inner_value in entry.items()
-                            ]
-                            bullets.append("• " + " | ".join(parts))
-                        story.append(
-                            _body_text(f"<b>{label}</b><br/>{'<br/>'.join(bullets)}")
+                            )
+                            for entry in value
                         )
                     else:
                         bullets = "<br/>".join(f"• {item}" for item in value)
-                        story.append(_body_text(f"<b>{label}</b><br/>{bullets}"))
+                    append(_body_text(f"<b>{label}</b><br/>{bullets}"))
                 else:
-                    story.append(_body_text(f"<b>{label}</b>: {value}"))
+                    append(_body_text(f"<b>{label}</b>: {value}"))
         else:
-            story.append(_body_text(str(data)))
-        story.append(Spacer(1, 0.25 * inch))
-
-    footer_style = ParagraphStyle(
-        "Footer",
-        fontName="Helvetica-Oblique",
-        fontSize=10,
-        alignment=1,
-        textColor=colors.grey,
-    )
+            append(_body_text(str(data)))
+        append(Spacer(1, 0.25 * inch))
+
     footer_text = (
         f"Akcero — From Idea to Product | Generated {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}"
     )
     story.append(Spacer(1, 0.6 * inch))
-    story.append(Paragraph(footer_text, footer_style))
-
-    def on_first_page(canvas_obj: canvas.Canvas, doc_obj: SimpleDocTemplate) -> None:
-        _build_header(canvas_obj, doc_obj.width + doc_obj.leftMargin + doc_obj.rightMargin, doc_obj.height + doc_obj.topMargin + doc_obj.bottomMargin)
+    story.append(Paragraph(footer_text, _FOOTER_STYLE))
 
-    doc.build(story, onFirstPage=on_first_page, onLaterPages=on_first_page)
-    return str(out_path)
+    doc.build(story, onFirstPage=_draw_page_header, onLaterPages=_draw_page_header)
@@ -2,21 +2,129 @@
 
 from __future__ import annotations
 
-import json
 import os
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-try:
-    from pymongo import MongoClient  # type: ignore
-    from pymongo.errors import PyMongoError  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    MongoClient = None  # type: ignore
-    PyMongoError = Exception  # type: ignore
+import orjson
+
+# pymongo and bson are imported on the first Mongo code path, so the file backend
+# never pays for them at startup.
+MongoClient: Any = None
+PyMongoError: Any = Exception
+_ObjectId: Any = None
 
 STORAGE_DIR = Path(__file__).resolve().parent.parent / "storage"
 STORAGE_DIR.mkdir(exist_ok=True)
+INDEX_PATH = STORAGE_DIR / "index.jsonl"
+_TAIL_CHUNK = 64 * 1024
+_INDEX_LOCK = threading.Lock()
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    # One write to a temporary sibling, then an atomic rename, so readers never see a partial run.
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(encoded)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> Any:
+    return _loads(path.read_bytes())
+
+
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw)
+
+
+def _index_line(entry: Dict[str, str]) -> bytes:
+    return orjson.dumps(entry) + b"\n"
+
+
+def _iso(value: Any) -> str:
+    # Mongo runs store created_at as a date; older documents hold ISO strings.
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def _summary_entry(data: Dict[str, Any], fallback_id: str) -> Dict[str, str]:
+    return {
+        "id": str(data.get("_id", fallback_id)),
+        "idea_text": data.get("idea_text", ""),
+        "created_at": data.get("created_at", ""),
+    }
+
+
+def _rebuild_index() -> None:
+    """Recreate the run index from the run files, oldest first."""
+
+    lines = []
+    # Run ids are timestamps, so ordering by file name is chronological across
+    # the year/month shards and the flat legacy layout alike.
+    for file in sorted(STORAGE_DIR.rglob("*.json"), key=lambda path: path.name):
+        try:
+            lines.append(_index_line(_summary_entry(_read_json(file), file.stem)))
+        except orjson.JSONDecodeError:
+            continue
+    INDEX_PATH.write_bytes(b"".join(lines))
+
+
+def _index_is_stale() -> bool:
+    """Whether a run landed in the newest shard after the index was last written.
+
+    Saving a run renames its file into ``YYYY/MM`` before appending the index line,
+    so a crash between the two leaves that shard directory newer than the index.
+    """
+
+    years = sorted(path for path in STORAGE_DIR.glob("[0-9][0-9][0-9][0-9]") if path.is_dir())
+    if not years:
+        return False
+    months = sorted(path for path in years[-1].iterdir() if path.is_dir())
+    if not months:
+        return False
+    return months[-1].stat().st_mtime_ns > INDEX_PATH.stat().st_mtime_ns
+
+
+def _ensure_index() -> None:
+    """Rebuild the run index when it is missing or stale; deleting it forces a rebuild."""
+
+    # The first index build also picks up runs saved before the index existed.
+    if not INDEX_PATH.exists() or _index_is_stale():
+        _rebuild_index()
+
+
+def _append_index(entry: Dict[str, str]) -> None:
+    if not INDEX_PATH.exists():
+        _rebuild_index()
+        return
+    with INDEX_PATH.open("ab") as handle:
+        handle.write(_index_line(entry))
+
+
+def _run_path(run_id: str) -> Path:
+    """Sharded location of a run file: ``storage/YYYY/MM/<run_id>.json``."""
+
+    return STORAGE_DIR / run_id[:4] / run_id[4:6] / f"{run_id}.json"
+
+
+def _tail_lines(path: Path, count: int) -> List[bytes]:
+    """Return the last ``count`` lines of ``path``, reading backwards in fixed chunks."""
+
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        buffer = b""
+        # One newline more than requested guarantees ``count`` complete lines.
+        while position > 0 and buffer.count(b"\n") <= count:
+            step = min(_TAIL_CHUNK, position)
+            position -= step
+            handle.seek(position)
+            buffer = handle.read(step) + buffer
+    lines = buffer.splitlines()
+    if position > 0:
+        lines = lines[1:]
+    return lines[-count:] if count > 0 else []
 
 
 class StorageManager:
@@ -35,26 +143,35 @@ class StorageManager:
     ) -> str:
         """Persist a single run and return its identifier."""
 
-        run_id = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
+        created_at = datetime.utcnow()
+        run_id = created_at.strftime("%Y%m%d%H%M%S%f")
 
         record = {
+            "_id": run_id,
             "idea_text": idea_text,
             "agents_output": agents_output,
             "blueprint": blueprint,
             "pitch": pitch,
-            "created_at": datetime.utcnow().isoformat(),
+            # A BSON date lets the created_at index order runs natively.
+            "created_at": created_at,
         }
 
         if self.backend == "mongo" and self.collection is not None:
             try:
-                self.collection.insert_one({"_id": run_id, **record})
+                self.collection.insert_one(record)
                 return run_id
             except PyMongoError:
                 pass
 
-        file_path = STORAGE_DIR / f"{run_id}.json"
-        with file_path.open("w", encoding="utf-8") as handle:
-            json.dump({"_id": run_id, **record}, handle, indent=2)
+        # Run files and index lines keep the ISO string, matching runs saved before the Mongo date.
+        record["created_at"] = created_at.isoformat()
+        file_path = _run_path(run_id)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # The run file and its index line are written under one lock so concurrent
+        # sessions never interleave them or rebuild the index in between.
+        with _INDEX_LOCK:
+            _write_json(file_path, record)
+            _append_index(_summary_entry(record, run_id))
         return run_id
 
     def list_runs(self, limit: int = 50) -> List[Dict[str, str]]:
@@ -71,7 +188,7 @@ class StorageManager:
                     {
                         "id": str(doc.get("_id")),
                         "idea_text": doc.get("idea_text", ""),
-                        "created_at": doc.get("created_at", ""),
+                        "created_at": _iso(doc.get("created_at", "")),
                     }
                     for doc in cursor
                 ]
@@ -79,21 +196,17 @@ class StorageManager:
                 # Fall back to file listing on errors.
                 pass
 
+        # The index holds one summary line per run in save order, so only its tail is parsed.
+        with _INDEX_LOCK:
+            _ensure_index()
+            lines = _tail_lines(INDEX_PATH, limit)
         runs = []
-        for file in sorted(STORAGE_DIR.glob("*.json"), reverse=True):
+        for line in reversed(lines):
             try:
-                with file.open("r", encoding="utf-8") as handle:
-                    data = json.load(handle)
-                runs.append(
-                    {
-                        "id": str(data.get("_id", file.stem)),
-                        "idea_text": data.get("idea_text", ""),
-                        "created_at": data.get("created_at", ""),
-                    }
-                )
-            except json.JSONDecodeError:
+                runs.append(_loads(line))
+            except orjson.JSONDecodeError:
                 continue
-        return runs[:limit]
+        return runs
 
     def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a single run by identifier."""
@@ -103,34 +216,72 @@ class StorageManager:
                 doc = self.collection.find_one({"_id": run_id})
                 if doc is None:
                     try:
-                        from bson import ObjectId  # type: ignore
-
-                        doc = self.collection.find_one({"_id": ObjectId(run_id)})
+                        doc = self.collection.find_one({"_id": _object_id(run_id)})
                     except Exception:
                         doc = None
                 return doc
             except PyMongoError:
                 pass
 
-        file_path = STORAGE_DIR / f"{run_id}.json"
+        file_path = _run_path(run_id)
         if not file_path.exists():
-            return None
-        with file_path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+            # Runs saved before sharding live directly under the storage directory.
+            file_path = STORAGE_DIR / f"{run_id}.json"
+            if not file_path.exists():
+                return None
+        return _read_json(file_path)
+
+
+def _import_pymongo() -> bool:
+    global MongoClient, PyMongoError
+    if MongoClient is None:
+        try:
+            from pymongo import MongoClient as client_cls  # type: ignore
+            from pymongo.errors import PyMongoError as error_cls  # type: ignore
+        except ImportError:  # pragma: no cover - optional dependency
+            return False
+        MongoClient, PyMongoError = client_cls, error_cls
+    return True
+
+
+def _object_id(value: str) -> Any:
+    global _ObjectId
+    if _ObjectId is None:
+        from bson import ObjectId as _ObjectId  # type: ignore
+    return _ObjectId(value)
+
+
+@lru_cache(maxsize=4)
+def _mongo_client(mongo_uri: str) -> Any:
+    """Connect once per URI; a failed ping raises, so unreachable servers are never cached."""
+
+    client = MongoClient(
+        mongo_uri,
+        serverSelectionTimeoutMS=2000,
+        maxPoolSize=50,
+        minPoolSize=5,
+        compressors="zlib",
+    )
+    # Attempt a ping to confirm connectivity.
+    client.admin.command("ping")
+    return client
 
 
 def get_db() -> StorageManager:
     """Return an initialized StorageManager based on environment configuration."""
 
     mongo_uri = os.getenv("MONGO_URI")
-    if mongo_uri and MongoClient is not None:
+    if mongo_uri and _import_pymongo():
         try:
-            client = MongoClient(mongo_uri, serverSelectionTimeoutMS=2000)
+            client = _mongo_client(mongo_uri)
             db_name = os.getenv("MONGO_DB_NAME", "akcero")
             db = client[db_name]
             collection = db["ideas"]
-            # Attempt a ping to confirm connectivity.
-            client.admin.command("ping")
+            try:
+                # Lets list_runs walk the newest runs off an index instead of sorting in memory.
+                collection.create_index([("created_at", -1)])
+            except PyMongoError:
+                pass
             return StorageManager(backend="mongo", collection=collection)
         except Exception:
             pass
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from html import escape
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List
 
 import streamlit as st
 
+from utils.labels import pretty_label
+
 ASSETS_PATH = Path(__file__).resolve().parent.parent / "assets"
 
 
@@ -16,22 +19,10 @@ DARK_TEXT = "#0A0A0A"
 LIGHT_BACKGROUND = "#F6F9FE"
 CARD_BACKGROUND = "#FFFFFF"
 
+_PAGE_ICON = str(ASSETS_PATH / "logo.png") if (ASSETS_PATH / "logo.png").exists() else "✨"
 
-def set_page() -> None:
-    """Configure Streamlit page defaults and inject custom CSS."""
-
-    logo_path = ASSETS_PATH / "logo.png"
-    st.set_page_config(
-        page_title="Akcero AI Product Builder",
-        page_icon=str(logo_path) if logo_path.exists() else "✨",
-        layout="wide",
-        menu_items={
-            "Get Help": "https://www.akcero.ai",
-            "About": "Akcero AI Product Builder — From Idea to Product",
-        },
-    )
-
-    css = f"""
+# Built once at import; the palette constants never change at runtime.
+_PAGE_CSS = f"""
     <style>
     :root {{
         --akcero-primary: {PRIMARY_COLOR};
@@ -215,75 +206,86 @@ def set_page() -> None:
     }}
     </style>
     """
-    st.markdown(css, unsafe_allow_html=True)
+
+
+def set_page() -> None:
+    """Configure Streamlit page defaults and inject custom CSS."""
+
+    st.set_page_config(
+        page_title="Akcero AI Product Builder",
+        page_icon=_PAGE_ICON,
+        layout="wide",
+        menu_items={
+            "Get Help": "https://www.akcero.ai",
+            "About": "Akcero AI Product Builder — From Idea to Product",
+        },
+    )
+
+    st.markdown(_PAGE_CSS, unsafe_allow_html=True)
+
+
+_CARD_HEADER_HTML = "<div class='akcero-card'><h3><span class='akcero-card-icon'>{}</span>{}</h3>"
+_BULLET_HTML = "<div class='akcero-bullet'><span class='akcero-bullet-icon'>◆</span>{}</div>"
+
+
+@lru_cache(maxsize=1024)
+def _pretty_label(key: str) -> str:
+    """Escaped, title-cased display label for a snake_case field name."""
+
+    return escape(pretty_label(key))
+
+
+def _chip_eligible(value: List[Any]) -> bool:
+    # Chips need every item to be a short string; one pass classifies the whole list.
+    for item in value:
+        if not isinstance(item, str) or len(item) > 40:
+            return False
+    return True
 
 
 def render_card(title: str, items: Iterable[str], icon: str) -> None:
     """Render a consistent card layout for agent output."""
 
-    with st.container():
-        st.markdown(
-            f"<div class='akcero-card'><h3><span class='akcero-card-icon'>{escape(icon)}</span>{escape(title)}</h3>",
-            unsafe_allow_html=True,
-        )
-        for item in items:
-            st.markdown(f"<div class='akcero-pill'>{escape(str(item))}</div>", unsafe_allow_html=True)
-        st.markdown("</div>", unsafe_allow_html=True)
+    parts = [_CARD_HEADER_HTML.format(escape(icon), escape(title))]
+    parts.extend(f"<div class='akcero-pill'>{escape(str(item))}</div>" for item in items)
+    parts.append("</div>")
+    # One markdown element per card keeps the pills inside the card wrapper.
+    st.markdown("".join(parts), unsafe_allow_html=True)
 
 
 def render_rich_card(title: str, icon: str, body: Dict[str, Any]) -> None:
     """Render structured content where values require more than pills."""
 
-    with st.container():
-        st.markdown(
-            f"<div class='akcero-card'><h3><span class='akcero-card-icon'>{escape(icon)}</span>{escape(title)}</h3>",
-            unsafe_allow_html=True,
-        )
-        sections: list[str] = []
-        for key, value in body.items():
-            label = escape(key.replace("_", " ").title())
-            section_parts: list[str] = [f"<div class='akcero-section'><div class='akcero-section-title'>{label}</div>"]
+    bullet = _BULLET_HTML.format
+    parts: list[str] = [_CARD_HEADER_HTML.format(escape(icon), escape(title))]
+    append = parts.append
+    for key, value in body.items():
+        append(f"<div class='akcero-section'><div class='akcero-section-title'>{_pretty_label(key)}</div>")
 
-            if isinstance(value, list) and value and all(isinstance(item, str) for item in value):
-                if all(len(item) <= 40 for item in value):
-                    chips = "".join(
-                        f"<span class='akcero-chip'>{escape(item)}</span>" for item in value
-                    )
-                    section_parts.append(f"<div class='akcero-chip-row'>{chips}</div>")
-                else:
-                    for entry in value:
-                        entry_text = escape(str(entry))
-                        section_parts.append(
-                            f"<div class='akcero-bullet'><span class='akcero-bullet-icon'>◆</span>{entry_text}</div>"
-                        )
-            elif isinstance(value, list):
+        if isinstance(value, list):
+            if value and _chip_eligible(value):
+                chips = "".join(
+                    f"<span class='akcero-chip'>{escape(item)}</span>" for item in value
+                )
+                append(f"<div class='akcero-chip-row'>{chips}</div>")
+            else:
                 for entry in value:
                     if isinstance(entry, dict):
-                        parts = [
-                            f"{escape(inner_key.replace('_', ' ').title())}: {escape(str(inner_value))}"
+                        entry_text = " | ".join(
+                            f"{_pretty_label(inner_key)}: {escape(str(inner_value))}"
                             for inner_key, inner_value in entry.items()
-                        ]
-                        entry_text = " | ".join(parts)
+                        )
                     else:
                         entry_text = escape(str(entry))
-                    section_parts.append(
-                        f"<div class='akcero-bullet'><span class='akcero-bullet-icon'>◆</span>{entry_text}</div>"
-                    )
-            elif isinstance(value, dict):
-                for entry_key, entry_value in value.items():
-                    entry_text = (
-                        f"{escape(entry_key.replace('_', ' ').title())}: {escape(str(entry_value))}"
-                    )
-                    section_parts.append(
-                        f"<div class='akcero-bullet'><span class='akcero-bullet-icon'>◆</span>{entry_text}</div>"
-                    )
-            else:
-                section_parts.append(
-                    f"<div class='akcero-bullet'><span class='akcero-bullet-icon'>◆</span>{escape(str(value))}</div>"
-                )
+                    append(bullet(entry_text))
+        elif isinstance(value, dict):
+            for entry_key, entry_value in value.items():
+                append(bullet(f"{_pretty_label(entry_key)}: {escape(str(entry_value))}"))
+        else:
+            append(bullet(escape(str(value))))
 
-            section_parts.append("</div>")
-            sections.append("".join(section_parts))
+        append("</div>")
 
-        st.markdown("".join(sections), unsafe_allow_html=True)
-        st.markdown("</div>", unsafe_allow_html=True)
+    append("</div>")
+    # One markdown element per card keeps the sections inside the card wrapper.
+    st.markdown("".join(parts), unsafe_allow_html=True)